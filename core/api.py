@@ -30,7 +30,9 @@ from services import SimpleS3Uploader
 from services.telemetry_publisher import (
     get_telemetry_publisher,
     publish_lidar_telemetry,
+    publish_lidar_telemetry_bytes,
     publish_occupancy_telemetry,
+    publish_occupancy_telemetry_bytes,
     publish_proximity_alert_telemetry,
     publish_environmental_telemetry,
     publish_telemetry
@@ -176,12 +178,15 @@ print("✅ Telemetry publisher service initialized with MQTT client")
 # Initialize the global MQTT client reference and streaming services
 mqtt_client = client
 lidar_control_service = get_lidar_control_service()
-lidar_streaming_service = get_lidar_streaming_service(telemetry_callback=publish_lidar_telemetry)
+lidar_streaming_service = get_lidar_streaming_service(telemetry_callback=publish_lidar_telemetry,
+                                                      telemetry_callback_bytes=publish_lidar_telemetry_bytes)
 lidar_control_service.set_telemetry_streaming_service(lidar_streaming_service)
 ultrasonic_streaming_service = get_ultrasonic_streaming_service(telemetry_callback=publish_telemetry)
 
-# Initialize the occupancy detector with telemetry callback
-occupancy_detector = get_occupancy_detector(telemetry_callback=publish_occupancy_telemetry)
+# Initialize the occupancy detector with telemetry callbacks; detections go out through the
+# bytes publisher (publish_occupancy_telemetry serializes synchronously, so result dicts can be pooled)
+occupancy_detector = get_occupancy_detector(telemetry_callback=publish_occupancy_telemetry, pool_safe=True,
+                                            telemetry_callback_bytes=publish_occupancy_telemetry_bytes)
 
 # Initialize the proximity detector with telemetry callback
 proximity_detector = get_ultrasonic_proximity_detector(telemetry_callback=publish_proximity_alert_telemetry)
@@ -30,11 +30,11 @@ def get_lidar_control_service():
         _lidar_control_service.set_data_collector(collector)
     return _lidar_control_service
 
-def get_lidar_streaming_service(telemetry_callback=None):
+def get_lidar_streaming_service(telemetry_callback=None, telemetry_callback_bytes=None):
     """Get the global LiDAR streaming service instance"""
     global _lidar_streaming_service
     if _lidar_streaming_service is None:
-        _lidar_streaming_service = LidarTelemetryStreamingService(telemetry_callback)
+        _lidar_streaming_service = LidarTelemetryStreamingService(telemetry_callback, telemetry_callback_bytes)
         # Connect with data collector
         collector = get_lidar_data_collector()
         _lidar_streaming_service.set_data_collector(collector)
@@ -47,11 +47,12 @@ def get_lidar_data_collector():
         _lidar_data_collector = LidarDataCollector()
     return _lidar_data_collector
 
-def get_occupancy_detector(telemetry_callback=None):
+def get_occupancy_detector(telemetry_callback=None, pool_safe=False, telemetry_callback_bytes=None):
     """Get the global occupancy detector instance"""
     global _occupancy_detector
     if _occupancy_detector is None:
-        _occupancy_detector = OccupancyDetector(telemetry_callback)
+        _occupancy_detector = OccupancyDetector(telemetry_callback, pool_safe=pool_safe,
+                                                telemetry_callback_bytes=telemetry_callback_bytes)
         # Connect with data collector
         collector = get_lidar_data_collector()
         _occupancy_detector.set_data_collector(collector)
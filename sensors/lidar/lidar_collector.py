@@ -71,7 +71,7 @@ class LidarDataCollector:
             print(f"📁 LiDAR telemetry file created: {filename}")
             
             # Start collection thread
-            self._collection_thread = threading.Thread(target=self._collection_loop, daemon=True)
+            self._collection_thread = threading.Thread(target=self._collection_loop, name="lidar-collector", daemon=True)
             self._collection_thread.start()
             
             print(f"🔄 LiDAR data collection started")
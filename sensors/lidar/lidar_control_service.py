@@ -6,10 +6,94 @@ and configuration management. It manages the lifecycle of LiDAR operations
 and coordinates with the telemetry streaming service.
 """
 
+import collections
+import functools
+import json
+import sys
 import threading
 import time
 import random
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+
+# Package-level telemetry accessor, resolved on first use (the package imports this module)
+_get_lidar_telemetry_data = None
+
+
+def _telemetry_data_getter():
+    """Return the package's get_lidar_telemetry_data function"""
+    global _get_lidar_telemetry_data
+    if _get_lidar_telemetry_data is None:
+        from . import get_lidar_telemetry_data as _get_lidar_telemetry_data
+    return _get_lidar_telemetry_data
+
+
+class GenParams(NamedTuple):
+    """Immutable view of the parameters used for telemetry generation."""
+    active: bool
+    scan_rate_hz: float
+    resolution: str
+    range_filter: Mapping[str, float]
+    temperature: float
+    status: str
+
+
+@dataclass(slots=True)
+class CaptureResult:
+    """Result of a timed LiDAR capture session."""
+    success: bool = False
+    scans_captured: int = 0
+    telemetry_files: List[str] = field(default_factory=list)
+    point_cloud_files: List[str] = field(default_factory=list)
+    capture_duration_actual: float = 0.0
+    total_points: int = 0
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary returned by the capture API"""
+        return asdict(self)
+
+
+def _error_result(error: str, active: bool = False) -> Dict[str, Any]:
+    """Build the result returned when a control operation fails"""
+    return {
+        "active": active,
+        "status": "error",
+        "error": error
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _estimate_capture_session(capture_duration_seconds: int, scan_rate_hz: float) -> Dict[str, Any]:
+    """
+    Compute capture session estimates for a duration and scan rate.
+    
+    Results are cached; callers must copy the returned dictionary before handing it out.
+    """
+    estimated_scans = int(capture_duration_seconds * scan_rate_hz)
+    estimated_points_per_scan = 275000  # Average point count
+    estimated_total_points = estimated_scans * estimated_points_per_scan
+    
+    # Estimate file sizes (approximate)
+    telemetry_size_per_file = 2048  # ~2KB per telemetry JSON
+    pcd_size_per_file = estimated_points_per_scan * 50  # ~50 bytes per point in ASCII
+    
+    return {
+        "estimated_scans": estimated_scans,
+        "estimated_total_points": estimated_total_points,
+        "estimated_points_per_scan": estimated_points_per_scan,
+        "scan_rate_hz": scan_rate_hz,
+        "scan_interval_seconds": 1.0 / scan_rate_hz,
+        "estimated_telemetry_files": estimated_scans,
+        "estimated_point_cloud_files": estimated_scans,
+        "estimated_telemetry_size_mb": (estimated_scans * telemetry_size_per_file) / (1024 * 1024),
+        "estimated_point_cloud_size_mb": (estimated_scans * pcd_size_per_file) / (1024 * 1024),
+        "capture_efficiency": 100.0  # LiDAR captures continuously
+    }
 
 
 class LidarControlService:
@@ -36,7 +120,71 @@ class LidarControlService:
         self._lock = threading.RLock()
         self._telemetry_streaming_service = None
         self._data_collector = None
+        # Monotonic start time for uptime; _state["last_started"] stays wall-clock ms for the API
+        self._started_monotonic = None
+        # Mirrors _state["active"] so hot paths can check it without the lock
+        self._active_event = threading.Event()
+        # Immutable views read without the lock by get_status_summary and
+        # get_effective_generation_params
+        self._snapshot = None
+        self._gen_params = None
+        self._idle_summary = (None, None, "")
+        self._publish_snapshot()
+        # Capture-loop log lines, drained to stdout by a background thread
+        self._log_q = collections.deque(maxlen=1024)
+        self._log_thread = None
+        # Scan file writes run here so the capture loop can start the next scan
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lidar-io")
+        # Point cloud content generators keyed by lower-case format name
+        self._format_emitters = {
+            "pcd": self._generate_pcd_content,
+            "las": self._generate_las_content,
+            "ply": self._generate_ply_content
+        }
         
+    def _publish_snapshot(self):
+        """Republish the lock-free status snapshot (call with _lock held)"""
+        state = self._state
+        self._snapshot = (
+            state["active"],
+            self._started_monotonic,
+            state["total_scans"],
+            state["scan_rate_hz"],
+            state["error_count"]
+        )
+        self._gen_params = GenParams(
+            active=state["active"],
+            scan_rate_hz=state["scan_rate_hz"],
+            resolution=state["resolution"],
+            range_filter=MappingProxyType(dict(state["range_filter"])),
+            temperature=state["temperature"],
+            status=state["status"]
+        )
+        
+    def _start_log_drain(self):
+        """Start the background thread that drains the capture log queue"""
+        with self._lock:
+            if self._log_thread is None:
+                self._log_thread = threading.Thread(target=self._log_drain_loop, name="lidar-log-drain", daemon=True)
+                self._log_thread.start()
+    
+    def _log_drain_loop(self):
+        """Write queued log lines to stdout in batches every 100 ms"""
+        while True:
+            time.sleep(0.1)
+            self._flush_log_queue()
+    
+    def _flush_log_queue(self):
+        """Write all currently queued log lines with a single stdout write"""
+        lines = []
+        while self._log_q:
+            try:
+                lines.append(self._log_q.popleft())
+            except IndexError:
+                break
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+    
     def set_telemetry_streaming_service(self, service):
         """Set the telemetry streaming service reference"""
         with self._lock:
@@ -51,87 +199,105 @@ class LidarControlService:
         """
         Start LiDAR scanning operations.
         
+        The lock only covers the state transition; the streaming service and
+        data collector are started after it is released.
+        
         Args:
             config: Optional configuration parameters
             
         Returns:
             Dictionary containing the operation result and current state
         """
-        with self._lock:
-            try:
+        try:
+            with self._lock:
                 # Apply configuration if provided
                 if config:
                     self._apply_configuration(config)
                 
                 # Start LiDAR operations
                 self._state["active"] = True
+                self._active_event.set()
                 self._state["status"] = "operational"
                 self._state["last_started"] = int(time.time() * 1000)
+                self._started_monotonic = time.monotonic()
                 self._state["error_count"] = 0
+                self._publish_snapshot()
                 
-                print(f"🟢 LiDAR Control Service started with config:")
-                print(f"   - Scan rate: {self._state['scan_rate_hz']} Hz")
-                print(f"   - Resolution: {self._state['resolution']}")
-                print(f"   - Range: {self._state['range_filter']['min_range_m']}m to {self._state['range_filter']['max_range_m']}m")
-                
-                # Start telemetry streaming if available
-                if self._telemetry_streaming_service:
-                    streaming_result = self._telemetry_streaming_service.start_streaming()
-                    print(f"📡 Telemetry streaming: {streaming_result}")
-                
-                # Start data collector if available
-                if self._data_collector:
-                    self._data_collector.start_collection(self._state)
-                
-                return self.current_state()
-                
-            except Exception as e:
+                state = self._state.copy()
+                streaming_service = self._telemetry_streaming_service
+                collector = self._data_collector
+            
+            print(f"🟢 LiDAR Control Service started with config:")
+            print(f"   - Scan rate: {state['scan_rate_hz']} Hz")
+            print(f"   - Resolution: {state['resolution']}")
+            print(f"   - Range: {state['range_filter']['min_range_m']}m to {state['range_filter']['max_range_m']}m")
+            
+            # Start telemetry streaming if available
+            if streaming_service:
+                streaming_result = streaming_service.start_streaming()
+                print(f"📡 Telemetry streaming: {streaming_result}")
+            
+            # Start data collector if available
+            if collector:
+                collector.start_collection(state)
+            
+            return self.current_state()
+            
+        except Exception as e:
+            with self._lock:
                 self._state["status"] = "error"
                 self._state["error_count"] += 1
-                print(f"❌ Failed to start LiDAR: {e}")
-                return {
-                    "active": False,
-                    "status": "error",
-                    "error": str(e)
-                }
+                self._publish_snapshot()
+            print(f"❌ Failed to start LiDAR: {e}")
+            return _error_result(str(e))
     
     def stop(self) -> Dict[str, Any]:
         """
         Stop LiDAR scanning operations.
         
+        The data collector and streaming service are stopped without holding
+        the lock; it is only taken to publish the idle state.
+        
         Returns:
             Dictionary containing the operation result and current state
         """
         with self._lock:
-            try:
-                # Stop data collector first
-                if self._data_collector:
-                    self._data_collector.stop_collection()
-                
-                # Stop telemetry streaming
-                if self._telemetry_streaming_service:
-                    streaming_result = self._telemetry_streaming_service.stop_streaming()
-                    print(f"📡 Telemetry streaming stopped: {streaming_result}")
-                
-                # Stop LiDAR operations
+            streaming_service = self._telemetry_streaming_service
+            collector = self._data_collector
+        
+        try:
+            # Stop data collector first
+            if collector:
+                collector.stop_collection()
+            
+            # Stop telemetry streaming
+            if streaming_service:
+                streaming_result = streaming_service.stop_streaming()
+                print(f"📡 Telemetry streaming stopped: {streaming_result}")
+            
+            # Stop LiDAR operations
+            with self._lock:
                 self._state["active"] = False
+                self._active_event.clear()
+                self._started_monotonic = None
                 self._state["status"] = "idle"
                 self._state["last_stopped"] = int(time.time() * 1000)
-                
-                print(f"🔴 LiDAR Control Service stopped")
-                print(f"   - Total scans collected: {self._state['total_scans']}")
-                
-                return self.current_state()
-                
-            except Exception as e:
+                self._publish_snapshot()
+                total_scans = self._state["total_scans"]
+            
+            print(f"🔴 LiDAR Control Service stopped")
+            print(f"   - Total scans collected: {total_scans}")
+            
+            return self.current_state()
+            
+        except Exception as e:
+            with self._lock:
                 self._state["status"] = "error"
                 self._state["error_count"] += 1
-                print(f"❌ Failed to stop LiDAR: {e}")
-                return {
-                    "active": True,  # Still considered active if stop failed
-                    "status": "error",
-                    "error": str(e)
-                }
+                self._publish_snapshot()
+            print(f"❌ Failed to stop LiDAR: {e}")
+            # Still considered active if stop failed
+            return _error_result(str(e), active=True)
     
     def reset(self) -> Dict[str, Any]:
         """
@@ -140,13 +306,13 @@ class LidarControlService:
         Returns:
             Dictionary containing the reset state
         """
-        with self._lock:
-            try:
-                # Stop first if running
-                if self._state["active"]:
-                    self.stop()
-                
-                # Reset to default configuration
+        try:
+            # Stop first if running
+            if self._active_event.is_set():
+                self.stop()
+            
+            # Reset to default configuration
+            with self._lock:
                 self._state.update({
                     "active": False,
                     "scan_rate_hz": 10.0,
@@ -161,17 +327,16 @@ class LidarControlService:
                     "last_started": None,
                     "last_stopped": None
                 })
-                
-                print(f"🔄 LiDAR Control Service reset to defaults")
-                return self.current_state()
-                
-            except Exception as e:
-                print(f"❌ Failed to reset LiDAR: {e}")
-                return {
-                    "active": False,
-                    "status": "error",
-                    "error": str(e)
-                }
+                self._active_event.clear()
+                self._started_monotonic = None
+                self._publish_snapshot()
+            
+            print(f"🔄 LiDAR Control Service reset to defaults")
+            return self.current_state()
+            
+        except Exception as e:
+            print(f"❌ Failed to reset LiDAR: {e}")
+            return _error_result(str(e))
     
     def apply_config(self, scan_rate_hz: Optional[float] = None, 
                     resolution: Optional[str] = None,
@@ -209,6 +374,15 @@ class LidarControlService:
         Returns:
             Dictionary containing the applied configuration
         """
+        # Fast path: nothing to apply when every requested value matches the current state;
+        # the requested settings are still reported with their (unchanged) current values
+        if not self._config_differs(config):
+            state = self._state
+            applied_config = {key: (dict(state[key]) if key == 'range_filter' else state[key])
+                              for key in config}
+            print(f"🔧 LiDAR configuration unchanged: {applied_config}")
+            return applied_config
+        
         applied_config = {}
         
         # Validate and apply scan rate
@@ -247,14 +421,32 @@ class LidarControlService:
             else:
                 raise ValueError("Range filter must be a dictionary with min_range_m and max_range_m")
         
+        self._publish_snapshot()
         print(f"🔧 LiDAR configuration applied: {applied_config}")
         
         # Update data collector with new parameters if active
-        if self._data_collector and self._state["active"]:
+        if self._data_collector and self._active_event.is_set():
             self._data_collector.update_parameters(self._state)
         
         return applied_config
     
+    def _config_differs(self, config: Dict[str, Any]) -> bool:
+        """Check whether applying config would change the current state"""
+        state = self._state
+        if 'scan_rate_hz' in config and config['scan_rate_hz'] != state['scan_rate_hz']:
+            return True
+        if 'resolution' in config and config['resolution'].lower() != state['resolution']:
+            return True
+        if 'range_filter' in config:
+            range_filter = config['range_filter']
+            if not isinstance(range_filter, dict):
+                return True
+            current = state['range_filter']
+            if (range_filter.get('min_range_m', current['min_range_m']) != current['min_range_m'] or
+                    range_filter.get('max_range_m', current['max_range_m']) != current['max_range_m']):
+                return True
+        return False
+    
     def current_state(self) -> Dict[str, Any]:
         """
         Get the current state of the LiDAR control service.
@@ -265,41 +457,48 @@ class LidarControlService:
         with self._lock:
             return self._state.copy()
     
-    def get_effective_generation_params(self) -> Dict[str, Any]:
+    def is_active(self) -> bool:
+        """Check whether scanning is active without taking the lock"""
+        return self._active_event.is_set()
+    
+    def get_effective_generation_params(self) -> GenParams:
         """
         Get the effective parameters for telemetry generation.
         
+        The returned tuple is shared and read-only; use ``_asdict()`` if a
+        mutable dictionary is needed.
+        
         Returns:
-            Dictionary containing parameters for telemetry generation
+            GenParams containing parameters for telemetry generation
         """
-        with self._lock:
-            return {
-                "active": self._state["active"],
-                "scan_rate_hz": self._state["scan_rate_hz"],
-                "resolution": self._state["resolution"],
-                "range_filter": self._state["range_filter"].copy(),
-                "temperature": self._state["temperature"],
-                "status": self._state["status"]
-            }
+        return self._gen_params
     
     def increment_scan_count(self):
         """Increment the total scan count (called by data collector)"""
         with self._lock:
             self._state["total_scans"] += 1
+            self._publish_snapshot()
     
     def update_temperature(self, temperature: float):
         """Update the LiDAR temperature reading"""
         with self._lock:
             self._state["temperature"] = temperature
+            self._publish_snapshot()
     
     def get_status_summary(self) -> str:
         """Get a human-readable status summary"""
-        with self._lock:
-            if self._state["active"]:
-                uptime = (time.time() * 1000 - self._state["last_started"]) / 1000 if self._state["last_started"] else 0
-                return f"Active for {uptime:.1f}s, {self._state['total_scans']} scans, {self._state['scan_rate_hz']}Hz"
-            else:
-                return f"Idle, {self._state['total_scans']} total scans, {self._state['error_count']} errors"
+        # The snapshot tuple is replaced atomically, so no lock is needed here
+        active, started_monotonic, total_scans, scan_rate_hz, error_count = self._snapshot
+        if active:
+            uptime = time.monotonic() - started_monotonic if started_monotonic else 0
+            return f"Active for {uptime:.1f}s, {total_scans} scans, {scan_rate_hz}Hz"
+        
+        # The idle summary only changes with the scan and error counters
+        cached_scans, cached_errors, summary = self._idle_summary
+        if cached_scans != total_scans or cached_errors != error_count:
+            summary = f"Idle, {total_scans} total scans, {error_count} errors"
+            self._idle_summary = (total_scans, error_count, summary)
+        return summary
 
     def timed_lidar_capture(
         self,
@@ -342,34 +541,21 @@ class LidarControlService:
         print(f"   Point cloud format: {point_cloud_format}")
         print(f"   Save location: {save_location or 'default temp'}")
         
-        # Validate point cloud format
-        valid_formats = ["pcd", "las", "ply"]
-        if point_cloud_format.lower() not in valid_formats:
-            return {
-                "success": False,
-                "error": f"Invalid point cloud format: {point_cloud_format}. Must be one of {valid_formats}",
-                "scans_captured": 0,
-                "telemetry_files": [],
-                "point_cloud_files": [],
-                "capture_duration_actual": 0.0,
-                "total_points": 0
-            }
+        # Validate point cloud format and resolve its content generator once
+        format_type = point_cloud_format.lower()
+        emitter = self._format_emitters.get(format_type)
+        if emitter is None:
+            valid_formats = list(self._format_emitters)
+            return CaptureResult(
+                error=f"Invalid point cloud format: {point_cloud_format}. Must be one of {valid_formats}"
+            ).to_dict()
         
         # Initialize results
-        results = {
-            "success": False,
-            "scans_captured": 0,
-            "telemetry_files": [],
-            "point_cloud_files": [],
-            "capture_duration_actual": 0.0,
-            "total_points": 0,
-            "error": None
-        }
+        results = CaptureResult()
         
         try:
             # Setup save directory
             if save_location:
-                from pathlib import Path
                 save_dir = Path(save_location)
                 save_dir.mkdir(parents=True, exist_ok=True)
             else:
@@ -406,15 +592,7 @@ class LidarControlService:
             if not was_originally_active:
                 start_result = self.start(default_params)
                 if not start_result.get("active", False):
-                    return {
-                        "success": False,
-                        "error": "Failed to start LiDAR for capture session",
-                        "scans_captured": 0,
-                        "telemetry_files": [],
-                        "point_cloud_files": [],
-                        "capture_duration_actual": 0.0,
-                        "total_points": 0
-                    }
+                    return CaptureResult(error="Failed to start LiDAR for capture session").to_dict()
                 print(f"✅ LiDAR started for capture session")
             else:
                 print(f"📡 Using already active LiDAR service")
@@ -429,15 +607,26 @@ class LidarControlService:
             print(f"   Scan interval: {scan_interval:.2f}s")
             print(f"   Expected scans: {expected_scans}")
             
+            # Point cloud filename parts are fixed for the whole session
+            filename_prefix = f"{device_id}_" if device_id else ""
+            filename_suffix = f"_pointcloud.{format_type}"
+            
+            # Per-scan messages go through the log queue instead of print()
+            log = self._log_q.append
+            self._start_log_drain()
+            
             # Track timing and data
             start_time = time.time()
             captured_files = []
             point_cloud_files = []
             total_points = 0
+            pending_writes = []
             
-            # Import telemetry functions
-            from .telemetry_file_saver import save_lidar_telemetry_to_file
-            from . import get_lidar_telemetry_data
+            get_lidar_telemetry_data = _telemetry_data_getter()
+            
+            # Readable timestamp is only reformatted when the second changes
+            last_second = -1
+            readable_time = ""
             
             scan_count = 0
             while True:
@@ -446,11 +635,11 @@ class LidarControlService:
                 
                 # Check if we should stop
                 if elapsed_time >= capture_duration_seconds:
-                    print(f"⏰ Capture duration reached: {elapsed_time:.2f}s")
+                    log(f"⏰ Capture duration reached: {elapsed_time:.2f}s")
                     break
                     
                 if stop_event and stop_event.is_set():
-                    print(f"🛑 Stop event triggered at {elapsed_time:.2f}s")
+                    log(f"🛑 Stop event triggered at {elapsed_time:.2f}s")
                     break
                 
                 try:
@@ -461,85 +650,125 @@ class LidarControlService:
                         scan_count += 1
                         
                         # Save telemetry data to JSON file
-                        timestamp = int(time.time() * 1000)
+                        now = time.time()
+                        timestamp = int(now * 1000)
                         telemetry_filename = f"lidar_telemetry_{timestamp}.json"
                         telemetry_path = save_dir / telemetry_filename
                         
+                        second = int(now)
+                        if second != last_second:
+                            readable_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+                            last_second = second
+                        
                         # Save with timestamp wrapper
                         telemetry_entry = {
-                            "timestamp": time.time(),
-                            "readable_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                            "timestamp": now,
+                            "readable_time": readable_time,
                             "device_id": device_id,
                             "scan_number": scan_count,
                             "data": lidar_data
                         }
                         
-                        with open(telemetry_path, 'w') as f:
-                            import json
-                            json.dump(telemetry_entry, f, indent=2)
-                        
-                        captured_files.append(str(telemetry_path))
-                        results["scans_captured"] += 1
+                        # Write telemetry and point cloud files on the I/O pool
+                        future = self._io_pool.submit(
+                            self._write_scan_files, telemetry_path, telemetry_entry,
+                            (save_dir, timestamp, format_type,
+                             lidar_data, device_id, scan_count,
+                             filename_prefix, filename_suffix, emitter)
+                        )
                         
                         # Extract point count for statistics
                         point_count = lidar_data.get("values", {}).get("lidar.point_count", 0)
-                        total_points += point_count
-                        
-                        # Generate point cloud file
-                        point_cloud_file = self._generate_point_cloud_file(
-                            save_dir, timestamp, point_cloud_format, 
-                            lidar_data, device_id, scan_count
-                        )
-                        
-                        if point_cloud_file:
-                            point_cloud_files.append(str(point_cloud_file))
+                        pending_writes.append((future, point_count))
                         
                         if scan_count % 10 == 0:
-                            print(f"📡 LiDAR: {scan_count} scans captured, {point_count} points in latest scan")
+                            log(f"📡 LiDAR: {scan_count} scans captured, {point_count} points in latest scan")
                     
                 except Exception as scan_error:
-                    print(f"❌ LiDAR scan error: {scan_error}")
+                    log(f"❌ LiDAR scan error: {scan_error}")
                 
                 # Wait for next scan
                 time.sleep(scan_interval)
             
+            # Collect file writes in scan order
+            for future, point_count in pending_writes:
+                try:
+                    telemetry_file, point_cloud_file = future.result()
+                except Exception as write_error:
+                    log(f"❌ LiDAR scan error: {write_error}")
+                    continue
+                
+                captured_files.append(telemetry_file)
+                results.scans_captured += 1
+                total_points += point_count
+                if point_cloud_file:
+                    point_cloud_files.append(point_cloud_file)
+            
+            # Emit any queued loop messages ahead of the summary
+            self._flush_log_queue()
+            
             # Calculate final results
             end_time = time.time()
-            results["capture_duration_actual"] = end_time - start_time
-            results["telemetry_files"] = captured_files
-            results["point_cloud_files"] = point_cloud_files
-            results["total_points"] = total_points
-            results["success"] = True
+            results.capture_duration_actual = end_time - start_time
+            results.telemetry_files = captured_files
+            results.point_cloud_files = point_cloud_files
+            results.total_points = total_points
+            results.success = True
             
             print(f"✅ Timed LiDAR capture completed:")
-            print(f"   Total scans: {results['scans_captured']}")
+            print(f"   Total scans: {results.scans_captured}")
             print(f"   Telemetry files: {len(captured_files)}")
             print(f"   Point cloud files: {len(point_cloud_files)}")
             print(f"   Total points: {total_points:,}")
-            print(f"   Actual duration: {results['capture_duration_actual']:.2f}s")
+            print(f"   Actual duration: {results.capture_duration_actual:.2f}s")
             print(f"   Files saved to: {save_dir}")
             
             # Restore original LiDAR state if we started it
-            if not was_originally_active and self._state["active"]:
+            if not was_originally_active and self._active_event.is_set():
                 print(f"🔄 Stopping LiDAR (was not originally active)")
                 self.stop()
             
         except Exception as e:
             error_msg = f"Timed LiDAR capture failed: {str(e)}"
             print(f"❌ {error_msg}")
-            results["error"] = error_msg
-            results["capture_duration_actual"] = time.time() - start_time if 'start_time' in locals() else 0
+            results.error = error_msg
+            results.capture_duration_actual = time.time() - start_time if 'start_time' in locals() else 0
         
-        return results
+        return results.to_dict()
+
+    def _write_scan_files(
+        self,
+        telemetry_path: Path,
+        telemetry_entry: Dict[str, Any],
+        point_cloud_args: tuple
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Write one scan's telemetry JSON and point cloud files (runs on the I/O pool).
+        
+        Args:
+            telemetry_path: Path of the telemetry JSON file
+            telemetry_entry: Telemetry entry to serialize
+            point_cloud_args: Positional arguments for _generate_point_cloud_file
+            
+        Returns:
+            Tuple of telemetry file path and point cloud file path (None if it failed)
+        """
+        with open(telemetry_path, 'w') as f:
+            json.dump(telemetry_entry, f, indent=2)
+        
+        return str(telemetry_path), self._generate_point_cloud_file(*point_cloud_args)
 
     def _generate_point_cloud_file(
         self, 
-        save_dir, 
+        save_dir: Path, 
         timestamp: int, 
         format_type: str, 
         lidar_data: Dict[str, Any], 
         device_id: str = None,
-        scan_number: int = 0
+        scan_number: int = 0,
+        filename_prefix: str = "",
+        filename_suffix: str = "",
+        emitter: Optional[Callable[[int, Dict[str, Any]], Iterable[bytes]]] = None
     ) -> Optional[str]:
         """
         Generate a point cloud file in the specified format.
@@ -547,26 +776,22 @@ class LidarControlService:
         Args:
             save_dir: Directory to save the file
             timestamp: Timestamp for filename
-            format_type: Point cloud format (pcd, las, ply)
+            format_type: Point cloud format (pcd, las, ply), already lower-cased
             lidar_data: LiDAR telemetry data
             device_id: Device identifier
             scan_number: Scan sequence number
+            filename_prefix: Precomputed filename prefix (e.g. "<device_id>_")
+            filename_suffix: Precomputed filename suffix (e.g. "_pointcloud.pcd")
+            emitter: Content generator for format_type (looked up if not given)
             
         Returns:
             Path to generated file or None if failed
         """
         try:
-            from pathlib import Path
-            import json
-            import random
-            
             # Generate filename
-            if device_id:
-                filename = f"{device_id}_{timestamp}_scan{scan_number:04d}_pointcloud.{format_type.lower()}"
-            else:
-                filename = f"{timestamp}_scan{scan_number:04d}_pointcloud.{format_type.lower()}"
-            
-            file_path = Path(save_dir) / filename
+            filename = f"{filename_prefix}{timestamp}_scan{scan_number:04d}{filename_suffix}"
+            file_path = save_dir / filename
+            format_label = format_type.upper()
             
             # Extract data from LiDAR telemetry
             values = lidar_data.get("values", {})
@@ -576,7 +801,7 @@ class LidarControlService:
             
             # For simulation, create metadata file alongside point cloud
             metadata = {
-                "format": format_type.upper(),
+                "format": format_label,
                 "timestamp": timestamp,
                 "scan_number": scan_number,
                 "device_id": device_id,
@@ -586,95 +811,108 @@ class LidarControlService:
                 "resolution": self._state.get("resolution", "medium"),
                 "scan_rate_hz": self._state.get("scan_rate_hz", 10.0),
                 "simulated": True,
-                "note": f"Simulated {format_type.upper()} point cloud data. In production, actual LiDAR hardware would generate real point cloud files."
+                "note": f"Simulated {format_label} point cloud data. In production, actual LiDAR hardware would generate real point cloud files."
             }
             
             # Create format-specific content
-            if format_type.lower() == "pcd":
-                content = self._generate_pcd_content(point_count, metadata)
-            elif format_type.lower() == "las":
-                content = self._generate_las_content(point_count, metadata)
-            elif format_type.lower() == "ply":
-                content = self._generate_ply_content(point_count, metadata)
+            if emitter is None:
+                emitter = self._format_emitters.get(format_type)
+            if emitter is not None:
+                content = emitter(point_count, metadata)
             else:
-                content = f"# Simulated {format_type.upper()} point cloud\n# Points: {point_count}\n"
+                content = (f"# Simulated {format_label} point cloud\n# Points: {point_count}\n".encode(),)
             
-            # Write point cloud file
-            with open(file_path, 'w') as f:
-                f.write(content)
+            # Stream the encoded chunks to the point cloud file
+            with open(file_path, 'wb') as f:
+                f.writelines(content)
             
             # Write metadata file
-            metadata_path = file_path.with_suffix(f'.{format_type.lower()}.json')
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            metadata_path = file_path.with_suffix(f'.{format_type}.json')
+            metadata_path.write_bytes(json.dumps(metadata, indent=2).encode())
             
-            print(f"📊 Generated {format_type.upper()} point cloud: {filename} ({point_count:,} points)")
             return str(file_path)
             
         except Exception as e:
             print(f"❌ Failed to generate point cloud file: {e}")
             return None
 
-    def _generate_pcd_content(self, point_count: int, metadata: Dict[str, Any]) -> str:
-        """Generate PCD format content"""
-        return f"""# .PCD v0.7 - Point Cloud Data file format
+    @staticmethod
+    def _content_fields(point_count: int, metadata: Dict[str, Any]) -> Dict[bytes, Any]:
+        """Build the %-format fields shared by the point cloud content templates"""
+        return {
+            b"points": point_count,
+            b"points_grouped": f"{point_count:,}".encode("ascii"),
+            b"device": str(metadata.get('device_id', 'unknown')).encode(),
+            b"scan": metadata.get('scan_number', 0)
+        }
+
+    def _generate_pcd_content(self, point_count: int, metadata: Dict[str, Any]) -> Iterator[bytes]:
+        """Generate PCD format content as a stream of chunks (header, then point data)"""
+        fields = self._content_fields(point_count, metadata)
+        yield b"""# .PCD v0.7 - Point Cloud Data file format
 VERSION 0.7
 FIELDS x y z intensity
 SIZE 4 4 4 4
 TYPE F F F F
 COUNT 1 1 1 1
-WIDTH {point_count}
+WIDTH %(points)d
 HEIGHT 1
 VIEWPOINT 0 0 0 1 0 0 0
-POINTS {point_count}
+POINTS %(points)d
 DATA ascii
-# Simulated PCD data - {point_count:,} points
-# Device: {metadata.get('device_id', 'unknown')}
-# Scan: {metadata.get('scan_number', 0)}
+""" % fields
+        yield b"""# Simulated PCD data - %(points_grouped)s points
+# Device: %(device)s
+# Scan: %(scan)d
 # In production, actual point cloud data would be here
-"""
+""" % fields
 
-    def _generate_las_content(self, point_count: int, metadata: Dict[str, Any]) -> str:
-        """Generate LAS format content"""
-        return f"""# LAS 1.2 Point Data Record Format
+    def _generate_las_content(self, point_count: int, metadata: Dict[str, Any]) -> Iterator[bytes]:
+        """Generate LAS format content as a stream of chunks (header, then point data)"""
+        fields = self._content_fields(point_count, metadata)
+        fields[b"creation_day"] = time.strftime('%j/%Y').encode("ascii")
+        yield b"""# LAS 1.2 Point Data Record Format
 # Public Header Block
 File Signature: LASF
 File Source ID: 0
-Project ID (GUID): {metadata.get('device_id', 'unknown')}
+Project ID (GUID): %(device)s
 Version Major: 1
 Version Minor: 2
 System Identifier: ThingsBoard LiDAR Simulator
 Generating Software: LiDAR Control Service
-File Creation Day/Year: {time.strftime('%j/%Y')}
+File Creation Day/Year: %(creation_day)s
 Header Size: 227
 Offset to point data: 227
 Number of Variable Length Records: 0
 Point Data Record Format: 1
 Point Data Record Length: 28
-Number of point records: {point_count}
-# Simulated LAS data - {point_count:,} points
-# Device: {metadata.get('device_id', 'unknown')}
-# Scan: {metadata.get('scan_number', 0)}
+Number of point records: %(points)d
+""" % fields
+        yield b"""# Simulated LAS data - %(points_grouped)s points
+# Device: %(device)s
+# Scan: %(scan)d
 # In production, actual LAS binary data would follow
-"""
+""" % fields
 
-    def _generate_ply_content(self, point_count: int, metadata: Dict[str, Any]) -> str:
-        """Generate PLY format content"""
-        return f"""ply
+    def _generate_ply_content(self, point_count: int, metadata: Dict[str, Any]) -> Iterator[bytes]:
+        """Generate PLY format content as a stream of chunks (header, then point data)"""
+        fields = self._content_fields(point_count, metadata)
+        yield b"""ply
 format ascii 1.0
 comment Simulated PLY point cloud data
-comment Device: {metadata.get('device_id', 'unknown')}
-comment Scan: {metadata.get('scan_number', 0)}
-comment Points: {point_count:,}
-element vertex {point_count}
+comment Device: %(device)s
+comment Scan: %(scan)d
+comment Points: %(points_grouped)s
+element vertex %(points)d
 property float x
 property float y
 property float z
 property float intensity
 end_header
-# Simulated PLY data - {point_count:,} points
+""" % fields
+        yield b"""# Simulated PLY data - %(points_grouped)s points
 # In production, actual point coordinates would be listed here
-"""
+""" % fields
 
     def estimate_lidar_capture_session(
         self,
@@ -690,27 +928,16 @@ end_header
             
         Returns:
             dict: Estimated capture session results
+            
+        Raises:
+            ValueError: If the scan rate is outside 1.0-50.0 Hz
         """
         
-        effective_scan_rate = scan_rate_hz or self._state["scan_rate_hz"]
-        estimated_scans = int(capture_duration_seconds * effective_scan_rate)
-        estimated_points_per_scan = 275000  # Average point count
-        estimated_total_points = estimated_scans * estimated_points_per_scan
+        effective_scan_rate = float(self._state["scan_rate_hz"] if scan_rate_hz is None else scan_rate_hz)
         
-        # Estimate file sizes (approximate)
-        telemetry_size_per_file = 2048  # ~2KB per telemetry JSON
-        pcd_size_per_file = estimated_points_per_scan * 50  # ~50 bytes per point in ASCII
+        # Validate the override like _apply_configuration so bad rates are never cached
+        if not 1.0 <= effective_scan_rate <= 50.0:
+            raise ValueError(f"Invalid scan rate: {effective_scan_rate}. Must be between 1.0 and 50.0 Hz")
         
-        return {
-            "estimated_scans": estimated_scans,
-            "estimated_total_points": estimated_total_points,
-            "estimated_points_per_scan": estimated_points_per_scan,
-            "scan_rate_hz": effective_scan_rate,
-            "scan_interval_seconds": 1.0 / effective_scan_rate,
-            "estimated_telemetry_files": estimated_scans,
-            "estimated_point_cloud_files": estimated_scans,
-            "estimated_telemetry_size_mb": (estimated_scans * telemetry_size_per_file) / (1024 * 1024),
-            "estimated_point_cloud_size_mb": (estimated_scans * pcd_size_per_file) / (1024 * 1024),
-            "capture_efficiency": 100.0  # LiDAR captures continuously
-        }
+        return dict(_estimate_capture_session(capture_duration_seconds, effective_scan_rate))
 
@@ -6,56 +6,109 @@ It coordinates with the data collector to get telemetry data and publishes it
 via the provided callback function.
 """
 
+import json
+import queue
 import threading
 import time
-import sys
-from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 
-# Add services to path for telemetry saver import
-sys.path.append(str(Path(__file__).parent.parent.parent / 'services'))
+from ..loop_logger import get_loop_logger
+from ..telemetry_bus import get_telemetry_bus
 
 try:
-    from telemetry_saver import save_telemetry
+    from services.telemetry_saver import save_telemetry_bulk
     TELEMETRY_SAVER_AVAILABLE = True
     print("✅ Telemetry saver imported successfully for LiDAR")
 except ImportError as e:
     TELEMETRY_SAVER_AVAILABLE = False
     print(f"⚠️ Telemetry saver not available for LiDAR: {e}")
 
+# Hot-loop messages go through a queued logger instead of print()
+logger = get_loop_logger(__name__)
+
+
+def _noop_save(*args, **kwargs):
+    """Stand-in for the database save when the telemetry saver is unavailable"""
+    return True
+
 
 class LidarTelemetryStreamingService:
     """
     Service for streaming LiDAR telemetry data continuously.
     """
     
-    def __init__(self, telemetry_callback: Optional[Callable] = None):
+    # How long stop_streaming waits for the database writer to save what is queued
+    _WRITER_JOIN_TIMEOUT_SEC = 5.0
+    
+    def __init__(self, telemetry_callback: Optional[Callable] = None,
+                 telemetry_callback_bytes: Optional[Callable] = None):
         """
         Initialize the LiDAR telemetry streaming service.
         
         Args:
             telemetry_callback: Function to call with telemetry data for publishing
+            telemetry_callback_bytes: Function to call with the telemetry serialized as
+                JSON bytes; used instead of telemetry_callback when set
         """
         self._streaming = False
         self._telemetry_callback = telemetry_callback
-        self._streaming_thread = None
-        self._lock = threading.RLock()
+        self._telemetry_callback_bytes = telemetry_callback_bytes
+        self._lock = threading.Lock()
         self._data_collector = None
         self._stream_count = 0
         self._start_time = None
         
+        # Publishing runs on the shared telemetry bus thread
+        self._bus = get_telemetry_bus()
+        self._bus_name = "lidar"
+        
         # Streaming configuration
         self._streaming_interval = 1.0  # Default 1 second interval
         
+        # Database writes are queued and saved in batches by a writer thread
+        self._write_q = queue.Queue(maxsize=1024)
+        self._writer_thread = None
+        self._writer_stop = threading.Event()  # Replaced for each writer thread
+        self._write_batch_size = 256
+        self._drop_oldest_on_full = True  # False blocks the streaming loop instead
+        self._saved_count = 0
+        # Bound once so the publish path calls it unconditionally
+        self._save = self._enqueue_write if TELEMETRY_SAVER_AVAILABLE else _noop_save
+        
+        # Status fields that only change with configuration; see _refresh_status
+        self._status = {}
+        self._refresh_status()
+        
+    def _refresh_status(self):
+        """Rebuild the status scaffold after a state change (caller holds the lock or is __init__)"""
+        self._status = {
+            "streaming": self._streaming,
+            "interval_seconds": self._streaming_interval,
+            "total_transmissions": 0,
+            "duration_seconds": 0,
+            "avg_transmission_rate": 0,
+            "callback_available": self._telemetry_callback is not None or self._telemetry_callback_bytes is not None,
+            "collector_available": self._data_collector is not None,
+            "telemetry_saver_available": TELEMETRY_SAVER_AVAILABLE
+        }
+    
     def set_data_collector(self, collector):
         """Set the data collector reference"""
         with self._lock:
             self._data_collector = collector
+            self._refresh_status()
     
     def set_telemetry_callback(self, callback: Callable):
         """Set or update the telemetry callback function"""
         with self._lock:
             self._telemetry_callback = callback
+            self._refresh_status()
+    
+    def set_telemetry_callback_bytes(self, callback: Optional[Callable]):
+        """Set or clear the callback that receives telemetry as JSON bytes"""
+        with self._lock:
+            self._telemetry_callback_bytes = callback
+            self._refresh_status()
     
     def start_streaming(self, streaming_interval: float = 1.0) -> Dict[str, Any]:
         """
@@ -76,7 +129,7 @@ class LidarTelemetryStreamingService:
                         "streaming": True
                     }
                 
-                if not self._telemetry_callback:
+                if not (self._telemetry_callback or self._telemetry_callback_bytes):
                     return {
                         "success": False,
                         "message": "No telemetry callback function provided",
@@ -87,10 +140,19 @@ class LidarTelemetryStreamingService:
                 self._streaming = True
                 self._stream_count = 0
                 self._start_time = time.time()
+                self._refresh_status()
+                
+                # Publish from the shared telemetry bus
+                self._bus.register(self._bus_name, streaming_interval,
+                                   self._poll_telemetry, self._publish_telemetry)
                 
-                # Start streaming thread
-                self._streaming_thread = threading.Thread(target=self._streaming_loop, daemon=True)
-                self._streaming_thread.start()
+                # Start a fresh database writer thread with its own stop flag; one left
+                # over from a previous run only finishes draining what it already has
+                if TELEMETRY_SAVER_AVAILABLE:
+                    self._writer_stop = threading.Event()
+                    self._writer_thread = threading.Thread(target=self._writer_loop, args=(self._writer_stop,),
+                                                           name="lidar-db-writer", daemon=True)
+                    self._writer_thread.start()
                 
                 print(f"📡 LiDAR telemetry streaming started (interval: {streaming_interval}s)")
                 
@@ -126,18 +188,19 @@ class LidarTelemetryStreamingService:
                     }
                 
                 self._streaming = False
+                self._bus.unregister(self._bus_name)
+                self._refresh_status()
                 
-                # Wait for streaming thread to finish (with timeout)
-                if self._streaming_thread and self._streaming_thread.is_alive():
-                    print("⏳ Waiting for LiDAR streaming thread to stop...")
-                    # Don't join to avoid blocking RPC response
+                # The writer saves what is queued, then exits
+                self._writer_stop.set()
+                writer = self._writer_thread
                 
                 duration = time.time() - self._start_time if self._start_time else 0
                 
                 print(f"📡 LiDAR telemetry streaming stopped")
                 print(f"📊 Streaming stats: {self._stream_count} transmissions in {duration:.1f}s")
                 
-                return {
+                result = {
                     "success": True,
                     "message": f"LiDAR telemetry streaming stopped after {self._stream_count} transmissions",
                     "streaming": False,
@@ -152,6 +215,13 @@ class LidarTelemetryStreamingService:
                     "message": f"Failed to stop streaming: {str(e)}",
                     "streaming": True
                 }
+        
+        # Wait for the writer outside the lock; a slow database only delays this call
+        if writer is not None:
+            writer.join(self._WRITER_JOIN_TIMEOUT_SEC)
+            if writer.is_alive():
+                print(f"⚠️ LiDAR database writer still saving queued telemetry after {self._WRITER_JOIN_TIMEOUT_SEC}s")
+        return result
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -161,69 +231,103 @@ class LidarTelemetryStreamingService:
             Dictionary containing streaming status information
         """
         with self._lock:
-            duration = time.time() - self._start_time if self._start_time and self._streaming else 0
-            
-            return {
-                "streaming": self._streaming,
-                "interval_seconds": self._streaming_interval,
-                "total_transmissions": self._stream_count,
-                "duration_seconds": round(duration, 1),
-                "avg_transmission_rate": round(self._stream_count / duration, 2) if duration > 0 else 0,
-                "callback_available": self._telemetry_callback is not None,
-                "collector_available": self._data_collector is not None,
-                "telemetry_saver_available": TELEMETRY_SAVER_AVAILABLE
-            }
+            status = self._status.copy()
+            start_time = self._start_time if self._streaming else None
+        
+        # Only the counter and timing change between calls
+        count = self._stream_count
+        duration = time.time() - start_time if start_time else 0
+        status["total_transmissions"] = count
+        status["duration_seconds"] = round(duration, 1)
+        status["avg_transmission_rate"] = round(count / duration, 2) if duration > 0 else 0
+        return status
     
-    def _streaming_loop(self):
-        """Main streaming loop running in a separate thread."""
-        print(f"📡 LiDAR telemetry streaming loop started")
+    def _poll_telemetry(self) -> Optional[Dict[str, Any]]:
+        """Get the current telemetry from the data collector (telemetry bus producer)."""
+        if not self._data_collector:
+            logger.debug("⚠️ No LiDAR data collector available")
+            return None
         
-        while self._streaming:
-            try:
-                # Get current telemetry data from collector
-                if self._data_collector:
-                    telemetry_data = self._data_collector.get_current_telemetry()
-                    
-                    if telemetry_data and self._telemetry_callback:
-                        # Publish telemetry data via callback
-                        self._telemetry_callback(telemetry_data)
-                        
-                        # Save telemetry data to database if telemetry saver is available
-                        if TELEMETRY_SAVER_AVAILABLE:
-                            try:
-                                # Extract the values from telemetry data for database storage
-                                telemetry_values = telemetry_data.get('values', {})
-                                if telemetry_values:
-                                    # Save to database with sync_status=0 (successfully sent)
-                                    db_success = save_telemetry('lidar', telemetry_values, sync_status=0)
-                                    if db_success:
-                                        print(f"💾 LiDAR telemetry saved to database (stream #{self._stream_count + 1})")
-                                    else:
-                                        print(f"⚠️ Failed to save LiDAR telemetry to database")
-                            except Exception as db_error:
-                                print(f"❌ Database save error: {db_error}")
-                        
-                        with self._lock:
-                            self._stream_count += 1
-                        
-                        # Debug output (reduce frequency to avoid spam)
-                        if self._stream_count % 10 == 0:
-                            print(f"📡 LiDAR telemetry stream #{self._stream_count}: {telemetry_data['values'].get('lidar.point_count', 0)} points")
-                    else:
-                        if not telemetry_data:
-                            print(f"⚠️ No LiDAR telemetry data available")
-                        if not self._telemetry_callback:
-                            print(f"⚠️ No telemetry callback function available")
-                else:
-                    print(f"⚠️ No LiDAR data collector available")
-                
-                time.sleep(self._streaming_interval)
-                
-            except Exception as e:
-                print(f"❌ LiDAR streaming error: {e}")
-                time.sleep(1)  # Error recovery delay
+        telemetry_data = self._data_collector.get_current_telemetry()
+        if not telemetry_data:
+            logger.debug("⚠️ No LiDAR telemetry data available")
+            return None
+        if not (self._telemetry_callback or self._telemetry_callback_bytes):
+            logger.debug("⚠️ No telemetry callback function available")
+            return None
+        return telemetry_data
+    
+    def _publish_telemetry(self, telemetry_data: Dict[str, Any]):
+        """Publish one telemetry sample and queue it for the database (telemetry bus consumer)."""
+        # Publish telemetry data via callback, serialized once when the bytes callback is set
+        callback_bytes = self._telemetry_callback_bytes
+        if callback_bytes:
+            callback_bytes(json.dumps(telemetry_data, separators=(',', ':')).encode())
+        else:
+            self._telemetry_callback(telemetry_data)
+        
+        # Extract the values once for database storage and logging
+        telemetry_values = telemetry_data.get('values', {})
+        
+        # Queue telemetry data for the database writer (no-op without the telemetry saver)
+        if telemetry_values:
+            # Saved with sync_status=0 (successfully sent)
+            self._save(('lidar', telemetry_values, 0, int(time.time())))
+        
+        # Only the bus thread writes the counter, so no lock is needed
+        self._stream_count += 1
+        
+        # Debug output (reduce frequency to avoid spam)
+        if self._stream_count % 10 == 0:
+            logger.info("📡 LiDAR telemetry stream #%d: %s points",
+                        self._stream_count, telemetry_values.get('lidar.point_count', 0))
+    
+    def _enqueue_write(self, row):
+        """Queue a telemetry row for the database writer, applying the overflow policy"""
+        if not self._drop_oldest_on_full:
+            self._write_q.put(row)
+            return
         
-        print(f"📡 LiDAR telemetry streaming loop ended")
+        while True:
+            try:
+                self._write_q.put_nowait(row)
+                return
+            except queue.Full:
+                # Drop the oldest queued row to make room
+                try:
+                    self._write_q.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _writer_loop(self, stop: threading.Event):
+        """Save queued telemetry rows to the database in batches until stopped and drained."""
+        while not stop.is_set() or not self._write_q.empty():
+            try:
+                batch = [self._write_q.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+            
+            # Take whatever else is already queued, up to the batch size
+            while len(batch) < self._write_batch_size:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                saved = save_telemetry_bulk(batch)
+            except Exception as db_error:
+                logger.error("❌ Database save error: %s", db_error)
+                continue
+            
+            if saved < len(batch):
+                logger.warning("⚠️ Failed to save %d LiDAR telemetry rows to database", len(batch) - saved)
+            
+            # Periodic progress instead of one line per sample
+            previous = self._saved_count
+            self._saved_count += saved
+            if self._saved_count // 100 > previous // 100:
+                logger.info("💾 LiDAR telemetry saved to database (%d rows total)", self._saved_count)
     
     def update_streaming_interval(self, interval: float) -> bool:
         """
@@ -238,6 +342,8 @@ class LidarTelemetryStreamingService:
         with self._lock:
             if 0.1 <= interval <= 60.0:
                 self._streaming_interval = interval
+                self._bus.update_interval(self._bus_name, interval)
+                self._refresh_status()
                 print(f"🔧 LiDAR streaming interval updated to {interval}s")
                 return True
             else:
@@ -8,65 +8,196 @@ NOTE: Occupancy telemetry database saving is currently disabled.
 Only general LiDAR telemetry data is being saved to the database.
 """
 
+import collections
 import threading
 import time
 import random
-import sys
-from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Sequence, Tuple
 
-# Add services to path for telemetry saver import
-sys.path.append(str(Path(__file__).parent.parent.parent / 'services'))
+from ..loop_logger import get_loop_logger
 
 try:
-    from telemetry_saver import save_telemetry
+    from services.telemetry_saver import save_telemetry
     TELEMETRY_SAVER_AVAILABLE = True
     print("✅ Telemetry saver imported successfully for LiDAR occupancy detector")
 except ImportError as e:
     TELEMETRY_SAVER_AVAILABLE = False
     print(f"⚠️ Telemetry saver not available for LiDAR occupancy detector: {e}")
 
+# Hot-loop messages go through a queued logger instead of print()
+logger = get_loop_logger(__name__)
+
 
 class OccupancyDetector:
     """
     Detects occupancy based on LiDAR point cloud analysis.
     """
     
-    def __init__(self, telemetry_callback: Optional[Callable] = None):
+    # Pre-generated random draws: rows of uniform [0, 1) values consumed one row per detection.
+    # Row layout: 0 occupancy, 1 confidence noise, 2 height, 3 width, 4 length,
+    # 5 distance, 6 density noise, 7 spare
+    _RNG_POOL_SIZE = 4096  # Power of two so the index wraps with a mask
+    _RNG_ROW_WIDTH = 8
+    
+    # Occupancy probability by point-count band: below 260k, 260k-280k, above 280k
+    _OCCUPANCY_THRESHOLDS = (1 / 3, 0.5, 2 / 3)
+    
+    # Full occupancy telemetry shape with empty-space values; copied per detection
+    _EMPTY_TEMPLATE = {
+        "lidar.occupancy.detected": False,
+        "lidar.occupancy.confidence": 0.0,
+        "lidar.occupancy.object_height": 0.0,
+        "lidar.occupancy.object_width": 0.0,
+        "lidar.occupancy.object_length": 0.0,
+        "lidar.occupancy.distance_from_sensor": 0.0,
+        "lidar.occupancy.point_density": 0,
+        "lidar.occupancy.point_count": 0,
+        "lidar.occupancy.valid_points": 0,
+        "lidar.occupancy.data_quality": 0,
+        "lidar.occupancy.analysis_timestamp": 0
+    }
+    
+    # On-wire JSON for the same fixed shape, filled by %-formatting instead of json.dumps
+    _WIRE_TEMPLATE = (
+        b'{"ts":%d,"values":{'
+        b'"lidar.occupancy.detected":%s,'
+        b'"lidar.occupancy.confidence":%a,'
+        b'"lidar.occupancy.object_height":%a,'
+        b'"lidar.occupancy.object_width":%a,'
+        b'"lidar.occupancy.object_length":%a,'
+        b'"lidar.occupancy.distance_from_sensor":%a,'
+        b'"lidar.occupancy.point_density":%d,'
+        b'"lidar.occupancy.point_count":%d,'
+        b'"lidar.occupancy.valid_points":%d,'
+        b'"lidar.occupancy.data_quality":%a,'
+        b'"lidar.occupancy.analysis_timestamp":%d}}'
+    )
+    
+    def __init__(self, telemetry_callback: Optional[Callable] = None, pool_safe: bool = False,
+                 telemetry_callback_bytes: Optional[Callable] = None):
         """
         Initialize the occupancy detector.
         
         Args:
             telemetry_callback: Function to call with occupancy telemetry data
+            pool_safe: True if the callback is done with the result when it returns
+                (e.g. serializes it synchronously), allowing result dicts to be reused
+            telemetry_callback_bytes: Function to call with the occupancy telemetry as
+                JSON bytes; used instead of telemetry_callback when set
         """
         self._detecting = False
         self._telemetry_callback = telemetry_callback
-        self._detection_thread = None
-        self._lock = threading.RLock()
+        self._telemetry_callback_bytes = telemetry_callback_bytes
+        self._lock = threading.Lock()
         self._data_collector = None
         self._detection_count = 0
         self._start_time = None
         
         # Detection parameters
-        self._detection_interval = 0.1  # Check every 100ms for real-time detection
+        # Detection is push-driven: the data collector calls process_telemetry_data
+        # for every scan, so there is no polling interval and the rate follows the scan rate
         self._current_occupancy = False
         self._confidence_threshold = 0.75
         self._real_time_mode = True  # Enable real-time detection
         
+        # Recycled result dictionaries, only used when the callback does not keep them
+        self._pool_safe = pool_safe
+        self._result_pool = collections.deque(maxlen=16)
+        
+        # Random draw pool for the detection hot path
+        self._rng_pool = []
+        self._rng_idx = 0
+        self._refill_rng_pool()
+        
+        # Status fields that only change with configuration; see _refresh_status
+        self._status = {}
+        self._refresh_status()
+        
+    def _refill_rng_pool(self):
+        """Pre-generate a fresh pool of random draw rows"""
+        rand = random.random
+        width = self._RNG_ROW_WIDTH
+        self._rng_pool = [tuple([rand() for _ in range(width)]) for _ in range(self._RNG_POOL_SIZE)]
+    
+    def _next_draws(self) -> Tuple[float, ...]:
+        """Return the next row of pre-generated draws, refilling the pool when it wraps"""
+        idx = self._rng_idx
+        draws = self._rng_pool[idx]
+        self._rng_idx = (idx + 1) & (self._RNG_POOL_SIZE - 1)
+        if self._rng_idx == 0:
+            self._refill_rng_pool()
+        return draws
+        
+    def _acquire_result(self) -> Dict[str, Any]:
+        """Take a result dictionary from the pool, or create one with the full shape"""
+        try:
+            return self._result_pool.pop()
+        except IndexError:
+            return {"ts": 0, "values": self._EMPTY_TEMPLATE.copy()}
+    
+    def _release_result(self, result: Dict[str, Any]):
+        """Return a result dictionary to the pool for reuse"""
+        self._result_pool.append(result)
+    
+    def _refresh_status(self):
+        """Rebuild the status scaffold after a state change (caller holds the lock or is __init__)"""
+        self._status = {
+            "detecting": self._detecting,
+            "detection_mode": "per_scan",
+            "total_detections": 0,
+            "duration_seconds": 0,
+            "avg_detection_rate": 0,
+            "current_occupancy": False,
+            "confidence_threshold": self._confidence_threshold,
+            "callback_available": self._telemetry_callback is not None or self._telemetry_callback_bytes is not None,
+            "collector_available": self._data_collector is not None,
+            "telemetry_saver_available": TELEMETRY_SAVER_AVAILABLE,
+            "occupancy_telemetry_saving": False  # Currently disabled
+        }
+    
     def set_data_collector(self, collector):
         """Set the data collector reference"""
         with self._lock:
             self._data_collector = collector
+            self._refresh_status()
     
     def set_telemetry_callback(self, callback: Callable):
         """Set or update the telemetry callback function"""
         with self._lock:
             self._telemetry_callback = callback
+            self._refresh_status()
+    
+    def set_telemetry_callback_bytes(self, callback: Optional[Callable]):
+        """Set or clear the callback that receives occupancy telemetry as JSON bytes"""
+        with self._lock:
+            self._telemetry_callback_bytes = callback
+            self._refresh_status()
+    
+    def _serialize_result(self, occupancy_result: Dict[str, Any]) -> bytes:
+        """Serialize an occupancy result to JSON bytes using the fixed wire template"""
+        v = occupancy_result["values"]
+        return self._WIRE_TEMPLATE % (
+            occupancy_result["ts"],
+            b"true" if v["lidar.occupancy.detected"] else b"false",
+            v["lidar.occupancy.confidence"],
+            v["lidar.occupancy.object_height"],
+            v["lidar.occupancy.object_width"],
+            v["lidar.occupancy.object_length"],
+            v["lidar.occupancy.distance_from_sensor"],
+            v["lidar.occupancy.point_density"],
+            v["lidar.occupancy.point_count"],
+            v["lidar.occupancy.valid_points"],
+            v["lidar.occupancy.data_quality"],
+            v["lidar.occupancy.analysis_timestamp"],
+        )
     
     def start_detection(self) -> Dict[str, Any]:
         """
         Start occupancy detection.
         
+        This only enables processing; detections are driven by the data
+        collector calling process_telemetry_data for each new scan.
+        
         Returns:
             Dictionary containing the detection start result
         """
@@ -82,10 +213,7 @@ class OccupancyDetector:
                 self._detecting = True
                 self._detection_count = 0
                 self._start_time = time.time()
-                
-                # Start detection thread
-                self._detection_thread = threading.Thread(target=self._detection_loop, daemon=True)
-                self._detection_thread.start()
+                self._refresh_status()
                 
                 print(f"🎯 LiDAR occupancy detection started")
                 
@@ -93,7 +221,7 @@ class OccupancyDetector:
                     "success": True,
                     "message": "Occupancy detection started",
                     "detecting": True,
-                    "interval_seconds": self._detection_interval
+                    "detection_mode": "per_scan"
                 }
                 
             except Exception as e:
@@ -121,11 +249,7 @@ class OccupancyDetector:
                     }
                 
                 self._detecting = False
-                
-                # Wait for detection thread to finish (with timeout)
-                if self._detection_thread and self._detection_thread.is_alive():
-                    print("⏳ Waiting for occupancy detection thread to stop...")
-                    # Don't join to avoid blocking RPC response
+                self._refresh_status()
                 
                 duration = time.time() - self._start_time if self._start_time else 0
                 
@@ -156,21 +280,17 @@ class OccupancyDetector:
             Dictionary containing detection status information
         """
         with self._lock:
-            duration = time.time() - self._start_time if self._start_time and self._detecting else 0
-            
-            return {
-                "detecting": self._detecting,
-                "interval_seconds": self._detection_interval,
-                "total_detections": self._detection_count,
-                "duration_seconds": round(duration, 1),
-                "avg_detection_rate": round(self._detection_count / duration, 2) if duration > 0 else 0,
-                "current_occupancy": self._current_occupancy,
-                "confidence_threshold": self._confidence_threshold,
-                "callback_available": self._telemetry_callback is not None,
-                "collector_available": self._data_collector is not None,
-                "telemetry_saver_available": TELEMETRY_SAVER_AVAILABLE,
-                "occupancy_telemetry_saving": False  # Currently disabled
-            }
+            status = self._status.copy()
+            start_time = self._start_time if self._detecting else None
+        
+        # Only the counters and timing change between calls
+        count = self._detection_count
+        duration = time.time() - start_time if start_time else 0
+        status["total_detections"] = count
+        status["duration_seconds"] = round(duration, 1)
+        status["avg_detection_rate"] = round(count / duration, 2) if duration > 0 else 0
+        status["current_occupancy"] = self._current_occupancy
+        return status
     
     def process_telemetry_data(self, telemetry_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -181,152 +301,77 @@ class OccupancyDetector:
             telemetry_data: LiDAR telemetry data to analyze
             
         Returns:
-            Occupancy detection result or None if detection is not active
+            Occupancy detection result, or None if detection is not active or the
+            scan has no points. With pool_safe enabled the result is recycled by a later detection,
+            so copy it if it has to be kept.
         """
         if not self._detecting:
             return None
             
         try:
             if telemetry_data and 'values' in telemetry_data:
-                point_count = telemetry_data['values'].get('lidar.point_count', 0)
-                valid_points = telemetry_data['values'].get('lidar.valid_points', 0)
+                values_get = telemetry_data['values'].get
+                point_count = values_get('lidar.point_count', 0)
+                if not point_count:
+                    # Nothing to analyze (sensor warm-up or fault)
+                    return None
+                valid_points = values_get('lidar.valid_points', 0)
                 
-                # Perform occupancy analysis
-                occupancy_detected = self._analyze_point_cloud(point_count, valid_points)
-                confidence = self._calculate_confidence(point_count, valid_points)
+                # Reuse the scan timestamp rather than reading the clock again
+                ts = telemetry_data.get('ts') or int(time.time() * 1000)
                 
-                # Generate detailed occupancy data
-                occupancy_details = self._generate_detailed_occupancy_data(
-                    occupancy_detected, confidence, point_count, valid_points
-                )
+                # Perform occupancy analysis
+                draws = self._next_draws()
+                occupancy_detected = self._analyze_point_cloud(point_count, valid_points, draws)
+                confidence = self._calculate_confidence(point_count, valid_points, draws)
                 
-                # Create occupancy result
-                occupancy_result = {
-                    "ts": telemetry_data.get('ts', int(time.time() * 1000)),
-                    "values": occupancy_details
-                }
+                # Create occupancy result, reusing a pooled one when the callback allows it
+                pooled = self._pool_safe
+                if pooled:
+                    occupancy_result = self._acquire_result()
+                    occupancy_result["ts"] = ts
+                    self._generate_detailed_occupancy_data(
+                        occupancy_detected, confidence, point_count, valid_points, ts, draws,
+                        occupancy_result["values"]
+                    )
+                else:
+                    occupancy_result = {
+                        "ts": ts,
+                        "values": self._generate_detailed_occupancy_data(
+                            occupancy_detected, confidence, point_count, valid_points, ts, draws
+                        )
+                    }
                 
-                # Update internal state
-                with self._lock:
-                    self._current_occupancy = occupancy_detected
-                    self._detection_count += 1
+                # Update internal state (plain stores; the lock only guards start/stop)
+                self._current_occupancy = occupancy_detected
+                self._detection_count += 1
                 
                 # Send via callback if available - ONLY when occupancy is detected
-                if self._telemetry_callback and occupancy_detected:
-                    self._telemetry_callback(occupancy_result)
+                callback_bytes = self._telemetry_callback_bytes
+                if occupancy_detected and (callback_bytes or self._telemetry_callback):
+                    if callback_bytes:
+                        callback_bytes(self._serialize_result(occupancy_result))
+                    else:
+                        self._telemetry_callback(occupancy_result)
                     # Reduced logging - only show every 100th detection to reduce spam
                     if self._detection_count % 100 == 0:
-                        print(f"🚗 Occupancy DETECTED - telemetry published! (#{self._detection_count})")
+                        logger.info("🚗 Occupancy DETECTED - telemetry published! (#%d)", self._detection_count)
+                
+                if pooled:
+                    self._release_result(occupancy_result)
                 
                 return occupancy_result
                 
         except Exception as e:
-            print(f"❌ Real-time occupancy detection error: {e}")
+            logger.error("❌ Real-time occupancy detection error: %s", e)
             
         return None
     
-    def _detection_loop(self):
-        """Main detection loop running in a separate thread."""
-        print(f"🎯 LiDAR occupancy detection loop started")
-        
-        while self._detecting:
-            try:
-                # Perform occupancy detection
-                occupancy_result = self._detect_occupancy()
-                
-                if occupancy_result and self._telemetry_callback:
-                    occupancy_detected = occupancy_result['values']['lidar.occupancy.detected']
-                    
-                    # Only send telemetry when occupancy is TRUE
-                    if occupancy_detected:
-                        self._telemetry_callback(occupancy_result)
-                        
-                        # Save occupancy telemetry data to database if telemetry saver is available
-                        # COMMENTED OUT: Only saving general LiDAR telemetry for now
-                        # if TELEMETRY_SAVER_AVAILABLE:
-                        #     try:
-                        #         # Extract the values from occupancy result for database storage
-                        #         occupancy_values = occupancy_result.get('values', {})
-                        #         if occupancy_values:
-                        #             # Save to database with sync_status=0 (successfully sent)
-                        #             db_success = save_telemetry('lidar_occupancy', occupancy_values, sync_status=0)
-                        #             if db_success:
-                        #                 print(f"💾 LiDAR occupancy telemetry saved to database (detection #{self._detection_count + 1})")
-                        #             else:
-                        #                 print(f"⚠️ Failed to save LiDAR occupancy telemetry to database")
-                        #     except Exception as db_error:
-                        #         print(f"❌ Database save error: {db_error}")
-                        
-                        # Reduced logging - only show every 100th detection to reduce spam
-                        if self._detection_count % 100 == 0:
-                            print(f"🚗 Occupancy DETECTED - telemetry published! (#{self._detection_count})")
-                    
-                    with self._lock:
-                        self._detection_count += 1
-                        self._current_occupancy = occupancy_detected
-                    
-                    # Debug output (much reduced frequency)
-                    if self._detection_count % 500 == 0:
-                        print(f"🎯 Occupancy detection #{self._detection_count}: {self._current_occupancy}")
-                
-                time.sleep(self._detection_interval)
-                
-            except Exception as e:
-                print(f"❌ Occupancy detection error: {e}")
-                time.sleep(1)  # Error recovery delay
-        
-        print(f"🎯 LiDAR occupancy detection loop ended")
-    
-    def _detect_occupancy(self) -> Optional[Dict[str, Any]]:
-        """
-        Perform occupancy detection based on LiDAR data.
-        
-        Returns:
-            Dictionary containing occupancy telemetry data
-        """
-        current_time = int(time.time() * 1000)
-        
-        # Get current LiDAR telemetry data
-        if self._data_collector:
-            telemetry_data = self._data_collector.get_current_telemetry()
-            
-            if telemetry_data and 'values' in telemetry_data:
-                point_count = telemetry_data['values'].get('lidar.point_count', 0)
-                valid_points = telemetry_data['values'].get('lidar.valid_points', 0)
-                
-                # Simulate occupancy detection based on point count analysis
-                # In a real implementation, this would analyze the 3D point cloud
-                occupancy_detected = self._analyze_point_cloud(point_count, valid_points)
-                confidence = self._calculate_confidence(point_count, valid_points)
-                
-                # Generate detailed occupancy analysis
-                occupancy_details = self._generate_detailed_occupancy_data(
-                    occupancy_detected, confidence, point_count, valid_points
-                )
-                
-                return {
-                    "ts": current_time,
-                    "values": occupancy_details
-                }
-        
-        # Fallback: generate simulated occupancy data
-        occupancy_detected = random.choice([True, False, False, False])  # 25% chance of occupied
-        confidence = round(random.uniform(0.7, 0.95), 2)
-        fallback_point_count = random.randint(250000, 300000)
-        fallback_valid_points = int(fallback_point_count * random.uniform(0.92, 0.98))
-        
-        # Generate detailed fallback data
-        occupancy_details = self._generate_detailed_occupancy_data(
-            occupancy_detected, confidence, fallback_point_count, fallback_valid_points
-        )
-        
-        return {
-            "ts": current_time,
-            "values": occupancy_details
-        }
-    
     def _generate_detailed_occupancy_data(self, occupancy_detected: bool, confidence: float, 
-                                        point_count: int, valid_points: int) -> Dict[str, Any]:
+                                        point_count: int, valid_points: int,
+                                        ts: Optional[int] = None,
+                                        draws: Optional[Sequence[float]] = None,
+                                        out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate detailed occupancy data with object dimensions and characteristics.
         
@@ -335,64 +380,64 @@ class OccupancyDetector:
             confidence: Detection confidence level
             point_count: Total number of LiDAR points
             valid_points: Number of valid LiDAR points
+            ts: Analysis timestamp in milliseconds (current time if None)
+            draws: Row of random draws from _next_draws (a new row is taken if None)
+            out: Existing dictionary to fill in place (a new one is created if None)
             
         Returns:
             Dictionary containing detailed occupancy telemetry data
         """
-        occupancy_data = {
-            "lidar.occupancy.detected": occupancy_detected,
-            "lidar.occupancy.confidence": confidence
-        }
+        if out is None:
+            occupancy_data = self._EMPTY_TEMPLATE.copy()
+        else:
+            # Same keys as the template, so this overwrites values without resizing
+            occupancy_data = out
+            occupancy_data.update(self._EMPTY_TEMPLATE)
+        occupancy_data["lidar.occupancy.detected"] = occupancy_detected
+        occupancy_data["lidar.occupancy.confidence"] = confidence
         
         if occupancy_detected:
+            if draws is None:
+                draws = self._next_draws()
+            
             # Generate realistic object dimensions for an occupied space
             # Simulate typical vehicle dimensions with some variance
-            object_height = round(random.uniform(1.4, 2.1), 2)  # 1.4-2.1m (cars to SUVs)
-            object_width = round(random.uniform(1.6, 2.2), 2)   # 1.6-2.2m (standard vehicle width)
-            object_length = round(random.uniform(3.8, 5.5), 2)  # 3.8-5.5m (compact to large cars)
+            object_height = round(1.4 + 0.7 * draws[2], 2)  # 1.4-2.1m (cars to SUVs)
+            object_width = round(1.6 + 0.6 * draws[3], 2)   # 1.6-2.2m (standard vehicle width)
+            object_length = round(3.8 + 1.7 * draws[4], 2)  # 3.8-5.5m (compact to large cars)
             
             # Distance from sensor (varies based on parking space configuration)
-            distance_from_sensor = round(random.uniform(1.5, 8.0), 1)  # 1.5-8.0m
+            distance_from_sensor = round(1.5 + 6.5 * draws[5], 1)  # 1.5-8.0m
             
             # Point density based on object size and distance
             # Higher density for closer objects, lower for farther ones
             base_density = 200 - (distance_from_sensor * 15)  # Closer = denser
-            point_density = max(50, int(base_density + random.uniform(-30, 30)))
+            point_density = max(50, int(base_density - 30 + 60 * draws[6]))
             
-            occupancy_data.update({
-                "lidar.occupancy.object_height": object_height,
-                "lidar.occupancy.object_width": object_width,
-                "lidar.occupancy.object_length": object_length,
-                "lidar.occupancy.distance_from_sensor": distance_from_sensor,
-                "lidar.occupancy.point_density": point_density
-            })
-        else:
-            # For empty spaces, set object dimensions to 0 or null values
-            occupancy_data.update({
-                "lidar.occupancy.object_height": 0.0,
-                "lidar.occupancy.object_width": 0.0,
-                "lidar.occupancy.object_length": 0.0,
-                "lidar.occupancy.distance_from_sensor": 0.0,
-                "lidar.occupancy.point_density": 0
-            })
+            occupancy_data["lidar.occupancy.object_height"] = object_height
+            occupancy_data["lidar.occupancy.object_width"] = object_width
+            occupancy_data["lidar.occupancy.object_length"] = object_length
+            occupancy_data["lidar.occupancy.distance_from_sensor"] = distance_from_sensor
+            occupancy_data["lidar.occupancy.point_density"] = point_density
+        # For empty spaces the template already holds zero dimensions
         
         # Add additional analysis metadata
-        occupancy_data.update({
-            "lidar.occupancy.point_count": point_count,
-            "lidar.occupancy.valid_points": valid_points,
-            "lidar.occupancy.data_quality": round(valid_points / point_count if point_count > 0 else 0, 3),
-            "lidar.occupancy.analysis_timestamp": int(time.time() * 1000)
-        })
+        occupancy_data["lidar.occupancy.point_count"] = point_count
+        occupancy_data["lidar.occupancy.valid_points"] = valid_points
+        occupancy_data["lidar.occupancy.data_quality"] = round(valid_points / point_count if point_count > 0 else 0, 3)
+        occupancy_data["lidar.occupancy.analysis_timestamp"] = ts if ts is not None else int(time.time() * 1000)
         
         return occupancy_data
     
-    def _analyze_point_cloud(self, point_count: int, valid_points: int) -> bool:
+    def _analyze_point_cloud(self, point_count: int, valid_points: int,
+                             draws: Optional[Sequence[float]] = None) -> bool:
         """
         Analyze point cloud data to determine occupancy.
         
         Args:
             point_count: Total number of points in the scan
             valid_points: Number of valid points
+            draws: Row of random draws from _next_draws (a new row is taken if None)
             
         Returns:
             True if space is occupied, False otherwise
@@ -400,21 +445,22 @@ class OccupancyDetector:
         # Simplified occupancy detection logic
         # In reality, this would involve complex 3D analysis
         
-        # Higher point counts might indicate objects in the space
-        if point_count > 280000:
-            return random.choice([True, True, False])  # 67% chance occupied
-        elif point_count < 260000:
-            return random.choice([False, False, True])  # 33% chance occupied
-        else:
-            return random.choice([True, False])  # 50% chance occupied
+        draw = (draws if draws is not None else self._next_draws())[0]
+        
+        # Higher point counts might indicate objects in the space:
+        # 67% chance occupied above 280k points, 33% below 260k, 50% in between
+        band = (point_count > 280000) - (point_count < 260000) + 1
+        return draw < self._OCCUPANCY_THRESHOLDS[band]
     
-    def _calculate_confidence(self, point_count: int, valid_points: int) -> float:
+    def _calculate_confidence(self, point_count: int, valid_points: int,
+                              draws: Optional[Sequence[float]] = None) -> float:
         """
         Calculate confidence level of the occupancy detection.
         
         Args:
             point_count: Total number of points in the scan
             valid_points: Number of valid points
+            draws: Row of random draws from _next_draws (a new row is taken if None)
             
         Returns:
             Confidence value between 0.0 and 1.0
@@ -423,8 +469,9 @@ class OccupancyDetector:
         data_quality = valid_points / point_count if point_count > 0 else 0
         base_confidence = 0.7 + (data_quality * 0.25)  # 0.7 to 0.95 range
         
-        # Add some randomness
-        confidence = base_confidence + random.uniform(-0.05, 0.05)
+        # Add some randomness (+/- 0.05)
+        draw = (draws if draws is not None else self._next_draws())[1]
+        confidence = base_confidence - 0.05 + 0.1 * draw
         
         return round(max(0.5, min(0.99, confidence)), 2)
 
@@ -1,23 +1,183 @@
 """
 LiDAR Telemetry File Saver
 
-This module handles saving LiDAR telemetry data to JSON files in the data/telemetry directory.
+This module handles saving LiDAR telemetry data to JSON Lines files in the data/telemetry directory.
 This is used for backward compatibility with the existing API telemetry saving system.
+
+Each entry is appended as one JSON object per line, so a save never re-reads
+or rewrites earlier entries. Saving only encodes the entry and queues it; a
+background writer thread appends queued lines to the file in batches.
 """
 
+import atexit
+import collections
 import json
+import mmap
+import os
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from ..loop_logger import get_loop_logger
+
+# orjson is optional; it encodes straight to compact bytes
+try:
+    import orjson
+    _encode_entry = orjson.dumps
+except ImportError:
+    orjson = None
+
+    def _encode_entry(entry: Dict[str, Any]) -> bytes:
+        """Encode an entry as compact JSON bytes with the stdlib encoder"""
+        return json.dumps(entry, separators=(',', ':')).encode()
+
+
+# Per-save messages go through a queued logger instead of print()
+logger = get_loop_logger(__name__)
 
 # Global variable for LiDAR telemetry data saver
 _lidar_telemetry_saver = None
 
+# Last formatted readable_time as (epoch second, string); formatted once per second
+_readable_time_cache = (None, "")
+
+# Appended bytes are synced to disk once this much is pending or this long has passed
+_FLUSH_BYTES = 64 * 1024
+_FLUSH_INTERVAL_SEC = 1.0
+
+# Writer thread wake-up interval and queued line limit (oldest lines are dropped beyond it)
+_DRAIN_INTERVAL_SEC = 0.1
+_QUEUE_MAX_LINES = 4096
+
+# Memory-mapped appends: the file is pre-allocated in chunks and trimmed on reset/exit.
+# Off by default because a crash leaves zero padding after the last entry.
+_USE_MMAP = False
+_MMAP_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+class _FdAppender:
+    """
+    Append-only writer on a raw O_APPEND file descriptor.
+    
+    Each writelines call is one os.write of the joined batch; the kernel
+    positions every write at the end of the file. Supports the subset of the
+    file API the writer thread uses.
+    """
+    
+    def __init__(self, file_path: Path):
+        self._fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._offset = os.fstat(self._fd).st_size
+    
+    def write(self, data: bytes) -> int:
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        self._offset += len(data)
+        return len(data)
+    
+    def writelines(self, lines):
+        self.write(b"".join(lines))
+    
+    def tell(self) -> int:
+        return self._offset
+    
+    def flush(self):
+        pass  # Nothing is buffered in user space
+    
+    def fileno(self) -> int:
+        return self._fd
+    
+    def close(self):
+        os.close(self._fd)
+
+
+class _MmapAppender:
+    """
+    Append-only writer backed by a pre-allocated memory map.
+    
+    Supports the subset of the file API the writer thread uses.
+    """
+    
+    def __init__(self, file_path: Path, chunk_bytes: int = _MMAP_CHUNK_BYTES):
+        self._fd = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._offset = os.fstat(self._fd).st_size  # Append after existing content
+        self._chunk_bytes = chunk_bytes
+        self._map = None
+        self._size = 0
+        self._remap(self._offset + chunk_bytes)
+    
+    def _remap(self, size: int):
+        """Grow the file to size bytes and map all of it"""
+        if self._map is not None:
+            self._map.close()
+        os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        self._size = size
+    
+    def write(self, data: bytes) -> int:
+        end = self._offset + len(data)
+        if end > self._size:
+            self._remap(max(end, self._size + self._chunk_bytes))
+        self._map[self._offset:end] = data
+        self._offset = end
+        return len(data)
+    
+    def writelines(self, lines):
+        self.write(b"".join(lines))
+    
+    def tell(self) -> int:
+        return self._offset
+    
+    def flush(self):
+        self._map.flush()
+    
+    def fileno(self) -> int:
+        return self._fd
+    
+    def close(self):
+        """Unmap and trim the file to the bytes actually written"""
+        self._map.flush()
+        self._map.close()
+        os.ftruncate(self._fd, self._offset)
+        os.close(self._fd)
+
+
+def _write_pending(saver: Dict[str, Any], force: bool = False):
+    """Append queued lines to the file and flush by size or age (always if force)."""
+    with saver["write_lock"]:
+        lines = saver["queue"]
+        batch = []
+        while lines:
+            batch.append(lines.popleft())
+        
+        f = saver["file"]
+        if batch:
+            f.writelines(batch)
+            saver["pending_bytes"] += sum(map(len, batch))
+        
+        if saver["pending_bytes"] and (force or saver["pending_bytes"] >= _FLUSH_BYTES
+                                       or time.monotonic() - saver["last_flush"] >= _FLUSH_INTERVAL_SEC):
+            f.flush()
+            os.fsync(f.fileno())
+            saver["pending_bytes"] = 0
+            saver["last_flush"] = time.monotonic()
+
+
+def _writer_loop(saver: Dict[str, Any]):
+    """Drain the saver's queue until it is stopped, then write what is left."""
+    while not saver["stop"].wait(_DRAIN_INTERVAL_SEC):
+        try:
+            _write_pending(saver)
+        except Exception as e:
+            logger.error("❌ Error writing LiDAR telemetry file: %s", e)
+    _write_pending(saver, force=True)
+
 
 def save_lidar_telemetry_to_file(lidar_data: Dict[str, Any], filename: Optional[str] = None) -> bool:
     """
-    Save LiDAR telemetry data to JSON file in data/telemetry directory.
+    Save LiDAR telemetry data to a JSON Lines file in data/telemetry directory.
     
     This function maintains compatibility with the existing API telemetry saving system.
     It saves telemetry data in the format expected by the original API.
@@ -29,7 +189,7 @@ def save_lidar_telemetry_to_file(lidar_data: Dict[str, Any], filename: Optional[
     Returns:
         True if saved successfully, False otherwise
     """
-    global _lidar_telemetry_saver
+    global _lidar_telemetry_saver, _readable_time_cache
     
     try:
         # Initialize saver if not exists
@@ -40,44 +200,55 @@ def save_lidar_telemetry_to_file(lidar_data: Dict[str, Any], filename: Optional[
             # Create filename with timestamp if not provided
             if filename is None:
                 timestamp = int(time.time())
-                filename = f"api_lidar_telemetry_{timestamp}.json"
+                filename = f"api_lidar_telemetry_{timestamp}.jsonl"
             
             file_path = telemetry_dir / filename
             _lidar_telemetry_saver = {
                 "file_path": file_path,
-                "entries": 0
+                # Kept open for appends
+                "file": _MmapAppender(file_path) if _USE_MMAP else _FdAppender(file_path),
+                "entries": 0,
+                "dropped": 0,
+                "pending_bytes": 0,
+                "last_flush": time.monotonic(),
+                "queue": collections.deque(maxlen=_QUEUE_MAX_LINES),
+                "write_lock": threading.Lock(),
+                "stop": threading.Event()
             }
-            
-            # Initialize file with empty array
-            with open(file_path, 'w') as f:
-                json.dump([], f)
-        
-        # Read existing data
-        try:
-            with open(_lidar_telemetry_saver["file_path"], 'r') as f:
-                existing_data = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            existing_data = []
+            _lidar_telemetry_saver["thread"] = threading.Thread(
+                target=_writer_loop, args=(_lidar_telemetry_saver,),
+                name="lidar-file-writer", daemon=True
+            )
+            _lidar_telemetry_saver["thread"].start()
         
-        # Add new telemetry entry with timestamp
+        # Add new telemetry entry with timestamp (readable_time reformatted once per second)
+        now = time.time()
+        second = int(now)
+        if _readable_time_cache[0] != second:
+            _readable_time_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
         telemetry_entry = {
-            "timestamp": time.time(),
-            "readable_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now,
+            "readable_time": _readable_time_cache[1],
             "data": lidar_data
         }
-        existing_data.append(telemetry_entry)
         
-        # Write back to file
-        with open(_lidar_telemetry_saver["file_path"], 'w') as f:
-            json.dump(existing_data, f, indent=2)
+        # Queue one line for the writer thread; a full queue drops its oldest line
+        lines = _lidar_telemetry_saver["queue"]
+        if len(lines) == _QUEUE_MAX_LINES:
+            _lidar_telemetry_saver["dropped"] += 1
+        lines.append(_encode_entry(telemetry_entry) + b"\n")
         
         _lidar_telemetry_saver["entries"] += 1
-        print(f"✅ LiDAR telemetry saved to {_lidar_telemetry_saver['file_path'].name} (total: {_lidar_telemetry_saver['entries']} entries)")
+        # Periodic progress instead of one line per save
+        entries = _lidar_telemetry_saver["entries"]
+        logger.debug("✅ LiDAR telemetry saved to %s (total: %d entries)", _lidar_telemetry_saver["file_path"].name, entries)
+        if entries % 1000 == 0:
+            logger.info("✅ LiDAR telemetry saved to %s (total: %d entries)", _lidar_telemetry_saver["file_path"].name, entries)
         
         return True
         
     except Exception as e:
-        print(f"❌ Error saving LiDAR telemetry: {e}")
+        logger.error("❌ Error saving LiDAR telemetry: %s", e)
         return False
 
 
@@ -88,12 +259,17 @@ def get_lidar_telemetry_file_status() -> Dict[str, Any]:
     Returns:
         Dictionary containing file status information
     """
-    global _lidar_telemetry_saver
-    if _lidar_telemetry_saver:
+    saver = _lidar_telemetry_saver
+    if saver:
+        with saver["write_lock"]:
+            # Bytes written so far (a memory-mapped file is larger on disk until trimmed)
+            # plus lines still queued for the writer thread; nothing is flushed here
+            file_size = saver["file"].tell() + sum(map(len, list(saver["queue"])))
         return {
-            "file_path": str(_lidar_telemetry_saver["file_path"]),
-            "total_entries": _lidar_telemetry_saver["entries"],
-            "file_size_bytes": _lidar_telemetry_saver["file_path"].stat().st_size if _lidar_telemetry_saver["file_path"].exists() else 0
+            "file_path": str(saver["file_path"]),
+            "total_entries": saver["entries"],
+            "dropped_entries": saver["dropped"],
+            "file_size_bytes": file_size
         }
     return {"status": "No LiDAR telemetry file active"}
 
@@ -101,4 +277,13 @@ def get_lidar_telemetry_file_status() -> Dict[str, Any]:
 def reset_lidar_telemetry_saver():
     """Reset the LiDAR telemetry saver state."""
     global _lidar_telemetry_saver
+    if _lidar_telemetry_saver:
+        # The writer thread writes and flushes what is left before it exits
+        _lidar_telemetry_saver["stop"].set()
+        _lidar_telemetry_saver["thread"].join()
+        _lidar_telemetry_saver["file"].close()
     _lidar_telemetry_saver = None
+
+
+# Write out queued entries (and trim a memory-mapped file) at interpreter exit
+atexit.register(reset_lidar_telemetry_saver)
@@ -0,0 +1,52 @@
+"""
+Sensor Loop Logger
+
+Loggers for the sensor polling loops. Records are put on a queue and written
+to stdout by a single background listener thread, so the loops never block on
+console I/O.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+
+
+# Shared queue and listener for all loop loggers
+_log_queue = queue.SimpleQueue()
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def _start_listener():
+    """Start the background listener that writes queued records to stdout"""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            _listener = logging.handlers.QueueListener(_log_queue, handler)
+            _listener.start()
+            atexit.register(_listener.stop)
+
+
+def get_loop_logger(name: str, level: int = logging.INFO) -> logging.Logger:
+    """
+    Get a logger for a sensor loop whose output is written by a background thread.
+    
+    Args:
+        name: Logger name (normally the calling module's __name__)
+        level: Minimum level; debug messages are skipped at the default INFO
+        
+    Returns:
+        Logger that hands records to the shared queue
+    """
+    logger = logging.getLogger(name)
+    if not any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):
+        _start_listener()
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+        logger.setLevel(level)
+        logger.propagate = False
+    return logger
@@ -0,0 +1,150 @@
+"""
+Sensor Telemetry Bus
+
+A single background thread that publishes telemetry for every registered
+sensor. Each sensor registers a producer (returns the current telemetry or
+None) and a consumer (publishes it) with its own interval; the bus runs
+whichever sensor is due next instead of each sensor sleeping in its own thread.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .loop_logger import get_loop_logger
+
+logger = get_loop_logger(__name__)
+
+
+class _Registration:
+    """Producer/consumer pair and interval for one registered sensor"""
+
+    __slots__ = ("name", "interval", "producer", "consumer")
+
+    def __init__(self, name: str, interval: float, producer: Callable, consumer: Callable):
+        self.name = name
+        self.interval = interval
+        self.producer = producer
+        self.consumer = consumer
+
+
+class TelemetryBus:
+    """
+    Schedules telemetry publishing for all sensors on one shared thread.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._registrations: Dict[str, _Registration] = {}
+        # Heap of (due_monotonic, sequence, registration); entries for replaced
+        # or unregistered sensors are skipped when they come up
+        self._schedule = []
+        self._sequence = itertools.count()
+        self._thread = None
+        self._error_delay = 1.0  # Error recovery delay
+
+    def register(self, sensor_name: str, interval: float,
+                 producer: Callable[[], Optional[Any]], consumer: Callable[[Any], None]):
+        """
+        Register a sensor, or replace its existing registration.
+
+        Args:
+            sensor_name: Unique sensor name (e.g. 'lidar')
+            interval: Seconds between publishes
+            producer: Returns the telemetry to publish, or None to skip this tick
+            consumer: Called with each telemetry item the producer returns
+        """
+        registration = _Registration(sensor_name, interval, producer, consumer)
+        with self._cond:
+            self._registrations[sensor_name] = registration
+            self._push(time.monotonic(), registration)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="telemetry-bus", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def unregister(self, sensor_name: str) -> bool:
+        """
+        Stop publishing for a sensor.
+
+        Returns:
+            True if the sensor was registered
+        """
+        with self._cond:
+            return self._registrations.pop(sensor_name, None) is not None
+
+    def update_interval(self, sensor_name: str, interval: float) -> bool:
+        """
+        Change a registered sensor's interval, taking effect from its next publish.
+
+        Returns:
+            True if the sensor was registered
+        """
+        with self._cond:
+            registration = self._registrations.get(sensor_name)
+            if registration is None:
+                return False
+            registration.interval = interval
+            return True
+
+    def is_registered(self, sensor_name: str) -> bool:
+        """Check whether a sensor is currently registered"""
+        return sensor_name in self._registrations
+
+    def _push(self, due: float, registration: _Registration):
+        """Schedule a registration (caller holds the condition)"""
+        heapq.heappush(self._schedule, (due, next(self._sequence), registration))
+
+    def _run(self):
+        """Run the earliest due sensor, waiting until one is due."""
+        while True:
+            with self._cond:
+                while True:
+                    if not self._schedule:
+                        self._cond.wait()
+                        continue
+                    due, _, registration = self._schedule[0]
+                    if self._registrations.get(registration.name) is not registration:
+                        heapq.heappop(self._schedule)  # Stale entry
+                        continue
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        # Woken early by register() if a sooner sensor arrives
+                        self._cond.wait(delay)
+                        continue
+                    heapq.heappop(self._schedule)
+                    break
+
+            # Producer and consumer run outside the condition so register/unregister never wait on I/O
+            try:
+                telemetry_data = registration.producer()
+                if telemetry_data is not None:
+                    registration.consumer(telemetry_data)
+                # Schedule from the due time, not the finish time, so work time does not add drift
+                next_due = due + registration.interval
+            except Exception as e:
+                logger.error("❌ Telemetry bus error (%s): %s", registration.name, e)
+                next_due = time.monotonic() + self._error_delay
+
+            now = time.monotonic()
+            if next_due < now:
+                # Overran the interval: skip the missed ticks instead of publishing a burst
+                next_due = now
+
+            with self._cond:
+                if self._registrations.get(registration.name) is registration:
+                    self._push(next_due, registration)
+
+
+# Global telemetry bus instance
+_telemetry_bus = None
+
+
+def get_telemetry_bus() -> TelemetryBus:
+    """Get the global telemetry bus instance"""
+    global _telemetry_bus
+    if _telemetry_bus is None:
+        _telemetry_bus = TelemetryBus()
+    return _telemetry_bus
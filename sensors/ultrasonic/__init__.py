@@ -12,23 +12,32 @@ from .telemetry_file_saver import (
     save_ultrasonic_telemetry_to_file,
     get_ultrasonic_telemetry_file_status,
     reset_ultrasonic_telemetry_file,
-    get_ultrasonic_telemetry_summary
+    get_ultrasonic_telemetry_summary,
+    export_ultrasonic_telemetry_pretty,
+    flush_ultrasonic_telemetry_file
 )
+from .sensor_keys import DISTANCE_KEYS, CONFIDENCE_KEYS, TEMP_COMP_KEYS
+import bisect
+import functools
 import time
 import random
 from typing import Dict, Any, Optional
 
+# Confidence range by distance band: below 50cm, 50-150cm, 150-300cm, 300cm and beyond
+_CONFIDENCE_BAND_EDGES = (50, 150, 300)
+_CONFIDENCE_BANDS = ((0.95, 0.99), (0.90, 0.97), (0.85, 0.94), (0.80, 0.91))
+
+# Most recent generated sample as (ts, distances, confidences, temp_compensated),
+# shared with get_ultrasonic_summary so it does not generate a second sample
+_latest_sample = None
+
 # Global instances
-_ultrasonic_control_service = None
 _ultrasonic_streaming_service = None
-_proximity_detector = None
 
+@functools.cache
 def get_ultrasonic_control_service():
     """Get the global ultrasonic control service instance"""
-    global _ultrasonic_control_service
-    if _ultrasonic_control_service is None:
-        _ultrasonic_control_service = UltrasonicControlService()
-    return _ultrasonic_control_service
+    return UltrasonicControlService()
 
 def get_ultrasonic_streaming_service(telemetry_callback=None):
     """Get the global ultrasonic streaming service instance"""
@@ -42,10 +51,8 @@ def get_ultrasonic_streaming_service(telemetry_callback=None):
 
 def get_ultrasonic_proximity_detector(telemetry_callback=None):
     """Get the global ultrasonic proximity detector instance"""
-    global _proximity_detector
-    if _proximity_detector is None:
-        _proximity_detector = get_proximity_detector(telemetry_callback)
-    return _proximity_detector
+    # The detector singleton lives in proximity_detector; no second copy here
+    return get_proximity_detector(telemetry_callback)
 
 def get_ultrasonic_telemetry_data() -> Dict[str, Any]:
     """
@@ -54,6 +61,7 @@ def get_ultrasonic_telemetry_data() -> Dict[str, Any]:
     Returns:
         Dictionary containing ultrasonic telemetry data in ThingsBoard format
     """
+    global _latest_sample
     current_time = int(time.time() * 1000)
     
     # Generate data for 4 ultrasonic sensors with temperature compensation
@@ -63,29 +71,30 @@ def get_ultrasonic_telemetry_data() -> Dict[str, Any]:
     }
     
     # Temperature compensation is typically enabled for modern ultrasonic sensors
-    temp_compensation_enabled = random.choice([True, True, True, False])  # 75% chance enabled
+    temp_compensation_enabled = random.random() < 0.75  # 75% chance enabled
     
-    for sensor_id in range(1, 5):
-        # Generate realistic distance readings (5cm to 400cm range)
-        distance = round(random.uniform(5.0, 400.0), 1)
-        
-        # Confidence based on distance and environmental factors
-        # Closer objects generally have higher confidence
-        if distance < 50:
-            confidence = round(random.uniform(0.95, 0.99), 2)
-        elif distance < 150:
-            confidence = round(random.uniform(0.90, 0.97), 2)
-        elif distance < 300:
-            confidence = round(random.uniform(0.85, 0.94), 2)
-        else:
-            confidence = round(random.uniform(0.80, 0.91), 2)
-        
-        # Add sensor data to telemetry
-        telemetry_data["values"].update({
-            f"ultrasonic.sensor_{sensor_id}.distance_cm": distance,
-            f"ultrasonic.sensor_{sensor_id}.confidence": confidence,
-            f"ultrasonic.sensor_{sensor_id}.temperature_compensated": temp_compensation_enabled
-        })
+    # Draw all sensor readings in one batch, then build the values in a single pass
+    uniform = random.uniform
+    
+    # Generate realistic distance readings (5cm to 400cm range)
+    distances = [round(uniform(5.0, 400.0), 1) for _ in range(4)]
+    
+    # Confidence based on distance and environmental factors
+    # Closer objects generally have higher confidence; the band is looked up, not branched on
+    band_of = bisect.bisect_right
+    confidences = [
+        round(uniform(*_CONFIDENCE_BANDS[band_of(_CONFIDENCE_BAND_EDGES, distance)]), 2)
+        for distance in distances
+    ]
+    
+    # Add sensor data to telemetry
+    values = telemetry_data["values"]
+    for sensor_id, distance, confidence in zip(range(1, 5), distances, confidences):
+        values[DISTANCE_KEYS[sensor_id]] = distance
+        values[CONFIDENCE_KEYS[sensor_id]] = confidence
+        values[TEMP_COMP_KEYS[sensor_id]] = temp_compensation_enabled
+    
+    _latest_sample = (current_time, tuple(distances), tuple(confidences), temp_compensation_enabled)
     
     return telemetry_data
 
@@ -96,24 +105,13 @@ def get_ultrasonic_summary() -> Dict[str, Any]:
     Returns:
         Dictionary containing ultrasonic summary statistics
     """
-    # Get current telemetry data
-    telemetry = get_ultrasonic_telemetry_data()
-    values = telemetry.get("values", {})
-    
-    # Extract distances from all sensors
-    distances = []
-    confidences = []
-    temp_compensated_count = 0
-    
-    for sensor_id in range(1, 5):
-        distance = values.get(f"ultrasonic.sensor_{sensor_id}.distance_cm", 0)
-        confidence = values.get(f"ultrasonic.sensor_{sensor_id}.confidence", 0)
-        temp_comp = values.get(f"ultrasonic.sensor_{sensor_id}.temperature_compensated", False)
-        
-        distances.append(distance)
-        confidences.append(confidence)
-        if temp_comp:
-            temp_compensated_count += 1
+    # Summarize the latest generated sample; generate one only if none exists yet
+    sample = _latest_sample
+    if sample is None:
+        get_ultrasonic_telemetry_data()
+        sample = _latest_sample
+    _, distances, confidences, temp_comp = sample
+    temp_compensated_count = len(distances) if temp_comp else 0
     
     # Calculate summary statistics
     if distances:
@@ -207,5 +205,7 @@ __all__ = [
     'save_ultrasonic_telemetry_to_file',
     'get_ultrasonic_telemetry_file_status',
     'reset_ultrasonic_telemetry_file',
-    'get_ultrasonic_telemetry_summary'
+    'get_ultrasonic_telemetry_summary',
+    'export_ultrasonic_telemetry_pretty',
+    'flush_ultrasonic_telemetry_file'
 ]
@@ -8,6 +8,8 @@ NOTE: Proximity alert telemetry database saving is currently disabled.
 Only general ultrasonic telemetry data is being saved to the database.
 """
 
+import collections
+import itertools
 import threading
 import time
 import random
@@ -15,6 +17,9 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 
+from ..loop_logger import get_loop_logger
+from .sensor_keys import DISTANCE_KEYS, CONFIDENCE_KEYS, MAX_SENSORS
+
 # Add services to path for telemetry saver import
 sys.path.append(str(Path(__file__).parent.parent.parent / 'services'))
 
@@ -27,11 +32,27 @@ except ImportError as e:
     print(f"⚠️ Telemetry saver not available for ultrasonic proximity detector: {e}")
 
 
+# Per-alert messages go through a queued logger instead of print()
+logger = get_loop_logger(__name__)
+
+
 class ProximityDetector:
     """
     Detects proximity alerts based on ultrasonic sensor distance analysis.
     """
     
+    # Keys for sensors 1-4 in sensor order, for extracting readings into parallel lists
+    _SENSOR_IDS = tuple(range(1, MAX_SENSORS + 1))
+    _DISTANCE_KEYS = DISTANCE_KEYS[1:]
+    _CONFIDENCE_KEYS = CONFIDENCE_KEYS[1:]
+    
+    # Pending alerts kept for the publisher thread; under a burst the oldest are dropped
+    _ALERT_QUEUE_MAX = 1024
+    # How long a restart waits for the previous run's threads to finish draining
+    _THREAD_JOIN_TIMEOUT_SEC = 5.0
+    # A gap between external feeds longer than this is a new feed starting, not its cadence
+    _EXTERNAL_FEED_GAP_MAX_SEC = 30.0
+    
     def __init__(self, telemetry_callback: Optional[Callable] = None):
         """
         Initialize the proximity detector.
@@ -42,22 +63,40 @@ class ProximityDetector:
         self._detecting = False
         self._telemetry_callback = telemetry_callback
         self._detection_thread = None
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self._detection_count = 0
+        self._alert_counter = itertools.count(1)  # next() is atomic, so alerts are counted without the lock
         self._start_time = None
         
         # Detection parameters - configurable thresholds per sensor
         self._detection_interval = 0.5  # Check every 500ms for proximity alerts
-        self._sensor_thresholds = {
-            1: 50,  # cm - sensor 1 threshold
-            2: 50,  # cm - sensor 2 threshold  
-            3: 50,  # cm - sensor 3 threshold
-            4: 50   # cm - sensor 4 threshold
-        }
+        # Per-sensor thresholds in cm, indexed by sensor_id - 1
+        self._sensor_thresholds = [50, 50, 50, 50]
         self._confidence_threshold = 0.8  # Minimum confidence for valid reading
-        self._alert_duration_tracking = {}  # Track alert durations per sensor
+        # Alert start time per sensor (indexed by sensor_id - 1); 0.0 means no active alert
+        self._alert_starts = [0.0] * MAX_SENSORS
         self._real_time_mode = True  # Enable real-time detection
+        # Last time (monotonic) the streaming service fed data in, and the gap between
+        # its last two feeds; the detection loop only generates its own data while no
+        # external feed is active
+        self._last_external_feed = 0.0
+        self._external_feed_gap = 0.0
         
+        # Cached random bits for the simulated approach flag, consumed one per alert
+        self._rng_bits = 0
+        self._rng_n = 0
+        
+        # Alerts waiting to be published, as (proximity_result, alert_number); drained by the
+        # publisher thread so a burst of alerts never holds up detection on callback latency
+        self._alert_queue = collections.deque(maxlen=self._ALERT_QUEUE_MAX)
+        self._alert_ready = threading.Event()
+        self._alerts_dropped = 0
+        self._publisher_thread = None
+        
+    def _thresholds_by_sensor(self) -> Dict[int, float]:
+        """Sensor thresholds keyed by sensor ID, for status reporting"""
+        return dict(zip(self._SENSOR_IDS, self._sensor_thresholds))
+    
     def set_telemetry_callback(self, callback: Callable):
         """Set or update the telemetry callback function"""
         with self._lock:
@@ -70,6 +109,25 @@ class ProximityDetector:
         Returns:
             Dictionary containing the start result
         """
+        with self._lock:
+            if self._detecting:
+                return {
+                    "success": False,
+                    "message": "Proximity detection already active"
+                }
+            previous_threads = (self._detection_thread, self._publisher_thread)
+        
+        # A previous run's threads exit once they see _detecting cleared; wait for them
+        # (outside the lock) so two publishers never drain the same queue
+        for thread in previous_threads:
+            if thread is not None and thread.is_alive():
+                thread.join(self._THREAD_JOIN_TIMEOUT_SEC)
+                if thread.is_alive():
+                    return {
+                        "success": False,
+                        "message": "Previous proximity detection run is still shutting down"
+                    }
+        
         with self._lock:
             if self._detecting:
                 return {
@@ -79,23 +137,30 @@ class ProximityDetector:
             
             self._detecting = True
             self._detection_count = 0
+            self._alert_counter = itertools.count(1)
             self._start_time = time.time()
-            self._alert_duration_tracking = {}
+            self._alert_starts = [0.0] * MAX_SENSORS
+            self._alerts_dropped = 0
             
             # Start detection thread
             self._detection_thread = threading.Thread(target=self._detection_loop, daemon=True)
             self._detection_thread.start()
             
+            # Start alert publisher thread
+            self._publisher_thread = threading.Thread(target=self._publish_loop,
+                                                      name="proximity-alert-publisher", daemon=True)
+            self._publisher_thread.start()
+            
             print(f"🚨 Proximity detection started")
             print(f"   - Detection interval: {self._detection_interval}s")
-            print(f"   - Sensor thresholds: {self._sensor_thresholds}")
+            print(f"   - Sensor thresholds: {self._thresholds_by_sensor()}")
             print(f"   - Confidence threshold: {self._confidence_threshold}")
             
             return {
                 "success": True,
                 "message": "Proximity detection started successfully",
                 "detection_interval": self._detection_interval,
-                "sensor_thresholds": self._sensor_thresholds.copy(),
+                "sensor_thresholds": self._thresholds_by_sensor(),
                 "confidence_threshold": self._confidence_threshold
             }
     
@@ -114,6 +179,7 @@ class ProximityDetector:
                 }
             
             self._detecting = False
+            self._alert_ready.set()  # Wake the publisher so it drains and exits
             duration = time.time() - self._start_time if self._start_time else 0
             
             print(f"🚨 Proximity detection stopped")
@@ -140,10 +206,12 @@ class ProximityDetector:
             return {
                 "detecting": self._detecting,
                 "alerts_detected": self._detection_count,
+                "alerts_pending": len(self._alert_queue),
+                "alerts_dropped": self._alerts_dropped,
                 "duration_seconds": round(duration, 1),
                 "callback_available": self._telemetry_callback is not None,
                 "detection_interval": self._detection_interval,
-                "sensor_thresholds": self._sensor_thresholds.copy(),
+                "sensor_thresholds": self._thresholds_by_sensor(),
                 "confidence_threshold": self._confidence_threshold,
                 "real_time_mode": self._real_time_mode,
                 "telemetry_saver_available": TELEMETRY_SAVER_AVAILABLE,
@@ -155,6 +223,28 @@ class ProximityDetector:
         Process telemetry data immediately for real-time proximity detection.
         This method can be called directly when new telemetry data is available.
         
+        Args:
+            telemetry_data: Ultrasonic telemetry data to analyze
+            
+        Returns:
+            Proximity alert result or None if detection is not active
+        """
+        now = time.monotonic()
+        gap = now - self._last_external_feed
+        self._external_feed_gap = gap if gap <= self._EXTERNAL_FEED_GAP_MAX_SEC else 0.0
+        self._last_external_feed = now
+        return self._process_telemetry(telemetry_data)
+    
+    def _external_feed_active(self) -> bool:
+        """Whether an external feed is due again before it would be considered stopped"""
+        # Wait 1.5x the feed's own cadence, so a slow stream (2s by default) still counts
+        window = max(2 * self._detection_interval, 1.5 * self._external_feed_gap)
+        return time.monotonic() - self._last_external_feed < window
+    
+    def _process_telemetry(self, telemetry_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Analyze telemetry data for proximity alerts and queue any alert for publishing.
+        
         Args:
             telemetry_data: Ultrasonic telemetry data to analyze
             
@@ -166,26 +256,41 @@ class ProximityDetector:
             
         try:
             if telemetry_data and 'values' in telemetry_data:
+                # Extract all readings into parallel lists in sensor order
+                values_get = telemetry_data['values'].get
+                distances = [values_get(key, 999) for key in self._DISTANCE_KEYS]
+                confidences = [values_get(key, 0) for key in self._CONFIDENCE_KEYS]
+                
+                # Which sensors have a confident reading within their threshold
+                confidence_threshold = self._confidence_threshold
+                confident = [confidence >= confidence_threshold for confidence in confidences]
+                in_range = [ok and distance <= threshold
+                            for distance, threshold, ok in zip(distances, self._sensor_thresholds, confident)]
+                
+                if not any(in_range):
+                    # No alerts: only clear duration tracking for sensors that read clear
+                    alert_starts = self._alert_starts
+                    for index, ok in enumerate(confident):
+                        if ok:
+                            alert_starts[index] = 0.0
+                    return None
+                
                 # Analyze each sensor for proximity alerts
                 proximity_alerts = []
                 
-                for sensor_id in range(1, 5):
-                    distance_key = f"ultrasonic.sensor_{sensor_id}.distance_cm"
-                    confidence_key = f"ultrasonic.sensor_{sensor_id}.confidence"
-                    
-                    distance = telemetry_data['values'].get(distance_key, 999)
-                    confidence = telemetry_data['values'].get(confidence_key, 0)
-                    
+                for sensor_id, distance, confidence in zip(self._SENSOR_IDS, distances, confidences):
                     # Check if this sensor has a proximity alert
                     alert_data = self._analyze_proximity(sensor_id, distance, confidence)
                     if alert_data:
                         proximity_alerts.append(alert_data)
                 
-                # If we have proximity alerts, generate telemetry data
+                # If we have proximity alerts, queue the closest object for publishing
                 if proximity_alerts:
-                    # For simplicity, we'll send the alert for the closest object
                     closest_alert = min(proximity_alerts, key=lambda x: x["distance_cm"])
                     
+                    # Update internal state
+                    self._detection_count = next(self._alert_counter)
+                    
                     # Create proximity alert result
                     proximity_result = {
                         "ts": telemetry_data.get('ts', int(time.time() * 1000)),
@@ -198,34 +303,12 @@ class ProximityDetector:
                         }
                     }
                     
-                    # Update internal state
-                    with self._lock:
-                        self._detection_count += 1
-                    
-                    # Send via callback if available - ONLY when proximity is detected
+                    # Publish via callback if available - ONLY when proximity is detected
                     if self._telemetry_callback:
-                        self._telemetry_callback(proximity_result)
-                        
-                        # Save proximity alert telemetry data to database if telemetry saver is available
-                        # COMMENTED OUT: Only saving general ultrasonic telemetry for now
-                        # if TELEMETRY_SAVER_AVAILABLE:
-                        #     try:
-                        #         # Extract the values from proximity result for database storage
-                        #         proximity_values = proximity_result.get('values', {})
-                        #         if proximity_values:
-                        #             # Save to database with sync_status=0 (successfully sent)
-                        #             db_success = save_telemetry('ultrasonic_proximity', proximity_values, sync_status=0)
-                        #             if db_success:
-                        #                 print(f"💾 Ultrasonic proximity telemetry saved to database (alert #{self._detection_count})")
-                        #             else:
-                        #                 print(f"⚠️ Failed to save ultrasonic proximity telemetry to database")
-                        #     except Exception as db_error:
-                        #         print(f"❌ Database save error: {db_error}")
-                        
-                        sensor_id = closest_alert["sensor_id"]
-                        distance = closest_alert["distance_cm"]
-                        threshold = closest_alert["threshold_cm"]
-                        print(f"🚨 PROXIMITY ALERT: Sensor {sensor_id} detected object at {distance}cm (threshold: {threshold}cm) - telemetry published!")
+                        if len(self._alert_queue) == self._ALERT_QUEUE_MAX:
+                            self._alerts_dropped += 1  # append() below drops the oldest
+                        self._alert_queue.append((proximity_result, self._detection_count))
+                        self._alert_ready.set()
                     
                     return proximity_result
                 
@@ -247,7 +330,7 @@ class ProximityDetector:
         """
         with self._lock:
             if 1 <= sensor_id <= 4 and 5 <= threshold_cm <= 200:
-                self._sensor_thresholds[sensor_id] = threshold_cm
+                self._sensor_thresholds[sensor_id - 1] = threshold_cm
                 print(f"🔧 Sensor {sensor_id} proximity threshold updated to {threshold_cm}cm")
                 return True
             return False
@@ -273,17 +356,22 @@ class ProximityDetector:
         """Main detection loop running in a separate thread."""
         print(f"🚨 Proximity detection loop started")
         
+        # Resolved once per loop run; imported here to avoid circular imports
+        from . import get_ultrasonic_telemetry_data
+        
         while self._detecting:
             try:
-                # Import here to avoid circular imports
-                from . import get_ultrasonic_telemetry_data
+                # The streaming service is feeding real data; skip generating our own
+                if self._external_feed_active():
+                    time.sleep(self._detection_interval)
+                    continue
                 
                 # Get current ultrasonic telemetry data
                 telemetry_data = get_ultrasonic_telemetry_data()
                 
                 if telemetry_data:
                     # Process the telemetry data for proximity detection
-                    self.process_telemetry_data(telemetry_data)
+                    self._process_telemetry(telemetry_data)
                 
                 time.sleep(self._detection_interval)
                 
@@ -293,6 +381,54 @@ class ProximityDetector:
         
         print(f"🚨 Proximity detection loop ended")
     
+    def _publish_loop(self):
+        """Publish queued proximity alerts until detection stops and the queue is drained."""
+        alert_queue = self._alert_queue
+        
+        while self._detecting or alert_queue:
+            self._alert_ready.wait(self._detection_interval)
+            self._alert_ready.clear()
+            
+            while alert_queue:
+                try:
+                    proximity_result, alert_number = alert_queue.popleft()
+                except IndexError:
+                    break
+                
+                try:
+                    callback = self._telemetry_callback
+                    if callback:
+                        callback(proximity_result)
+                        
+                        # Save proximity alert telemetry data to database if telemetry saver is available
+                        # COMMENTED OUT: Only saving general ultrasonic telemetry for now
+                        # if TELEMETRY_SAVER_AVAILABLE:
+                        #     try:
+                        #         # Extract the values from proximity result for database storage
+                        #         proximity_values = proximity_result.get('values', {})
+                        #         if proximity_values:
+                        #             # Save to database with sync_status=0 (successfully sent)
+                        #             db_success = save_telemetry('ultrasonic_proximity', proximity_values, sync_status=0)
+                        #             if db_success:
+                        #                 print(f"💾 Ultrasonic proximity telemetry saved to database (alert #{self._detection_count})")
+                        #             else:
+                        #                 print(f"⚠️ Failed to save ultrasonic proximity telemetry to database")
+                        #     except Exception as db_error:
+                        #         print(f"❌ Database save error: {db_error}")
+                        
+                        # Every alert at debug level; only every 100th at info to reduce spam
+                        values = proximity_result["values"]
+                        sensor_id = values["ultrasonic.proximity_alert.sensor_id"]
+                        distance_cm = values["ultrasonic.proximity_alert.distance_cm"]
+                        threshold_cm = values["ultrasonic.proximity_alert.threshold_cm"]
+                        logger.debug("🚨 PROXIMITY ALERT: Sensor %d detected object at %scm (threshold: %scm) - telemetry published! (#%d)",
+                                     sensor_id, distance_cm, threshold_cm, alert_number)
+                        if alert_number % 100 == 0:
+                            logger.info("🚨 PROXIMITY ALERT: Sensor %d detected object at %scm (threshold: %scm) - telemetry published! (#%d)",
+                                        sensor_id, distance_cm, threshold_cm, alert_number)
+                except Exception as e:
+                    logger.error("❌ Proximity alert publish error: %s", e)
+    
     def _analyze_proximity(self, sensor_id: int, distance: float, confidence: float) -> Optional[Dict[str, Any]]:
         """
         Analyze sensor data for proximity alerts.
@@ -305,30 +441,34 @@ class ProximityDetector:
         Returns:
             Alert data dictionary if proximity detected, None otherwise
         """
-        # Check if we have a valid reading
+        # Check if we have a valid reading (before any threshold lookup)
         if confidence < self._confidence_threshold:
             return None
         
-        threshold = self._sensor_thresholds.get(sensor_id, 50)
+        threshold = self._sensor_thresholds[sensor_id - 1]
         
         # Check if object is within proximity threshold
         if distance <= threshold:
             # Track alert duration for this sensor
             current_time = time.time()
-            sensor_key = f"sensor_{sensor_id}"
+            start_time = self._alert_starts[sensor_id - 1]
             
-            if sensor_key not in self._alert_duration_tracking:
+            if start_time == 0.0:
                 # First time detecting proximity for this sensor
-                self._alert_duration_tracking[sensor_key] = current_time
+                self._alert_starts[sensor_id - 1] = current_time
                 duration_ms = 0
             else:
                 # Calculate how long this proximity alert has been active
-                start_time = self._alert_duration_tracking[sensor_key]
                 duration_ms = int((current_time - start_time) * 1000)
             
             # Determine if object is approaching (for demo, we'll simulate this)
             # In real implementation, this would compare with previous readings
-            object_approaching = random.choice([True, False])  # Simulate approach detection
+            if not self._rng_n:
+                self._rng_bits = random.getrandbits(64)
+                self._rng_n = 64
+            object_approaching = bool(self._rng_bits & 1)  # Simulate approach detection
+            self._rng_bits >>= 1
+            self._rng_n -= 1
             
             return {
                 "sensor_id": sensor_id,
@@ -340,9 +480,7 @@ class ProximityDetector:
             }
         else:
             # Object moved away, clear duration tracking for this sensor
-            sensor_key = f"sensor_{sensor_id}"
-            if sensor_key in self._alert_duration_tracking:
-                del self._alert_duration_tracking[sensor_key]
+            self._alert_starts[sensor_id - 1] = 0.0
         
         return None
 
@@ -0,0 +1,12 @@
+"""
+Ultrasonic Telemetry Keys
+
+Per-sensor telemetry key strings, built once and indexed by sensor ID (1-4).
+Index 0 is unused so that KEYS[sensor_id] needs no offset.
+"""
+
+MAX_SENSORS = 4
+
+DISTANCE_KEYS = tuple(f"ultrasonic.sensor_{i}.distance_cm" for i in range(MAX_SENSORS + 1))
+CONFIDENCE_KEYS = tuple(f"ultrasonic.sensor_{i}.confidence" for i in range(MAX_SENSORS + 1))
+TEMP_COMP_KEYS = tuple(f"ultrasonic.sensor_{i}.temperature_compensated" for i in range(MAX_SENSORS + 1))
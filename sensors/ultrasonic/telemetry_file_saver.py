@@ -1,23 +1,232 @@
 """
 Ultrasonic Telemetry File Saver
 
-This module handles saving ultrasonic telemetry data to JSON files in data/telemetry/
-with the format: api_ultrasonic_telemetry_<timestamp>.json
+This module handles saving ultrasonic telemetry data to JSON Lines files in data/telemetry/
+with the format: api_ultrasonic_telemetry_<timestamp>.jsonl
+
+Each entry is appended as one JSON object per line, so a save never re-reads
+or rewrites earlier entries. Saving only encodes the entry and queues it; a
+background writer thread appends queued lines to the file in batches.
 """
 
+import atexit
+import collections
+import itertools
 import json
+import os
+import statistics
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from .sensor_keys import DISTANCE_KEYS, CONFIDENCE_KEYS, TEMP_COMP_KEYS, MAX_SENSORS
+
+# orjson is optional; it encodes straight to compact bytes with the newline appended
+try:
+    import orjson
+    _decode_entry = orjson.loads
+    
+    def _encode_line(entry: Dict[str, Any]) -> bytes:
+        """Encode an entry as one compact JSON line with orjson"""
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    orjson = None
+    _decode_entry = json.loads
+    
+    # Entries always have the same four keys, so only "data" goes through the
+    # stdlib encoder; %a renders the float timestamp as its JSON-compatible repr
+    _ENTRY_TEMPLATE = b'{"timestamp":%a,"readable_time":"%s","entry_number":%d,"data":%s}\n'
+    
+    def _encode_line(entry: Dict[str, Any]) -> bytes:
+        """Encode an entry as one compact JSON line with the stdlib encoder"""
+        return _ENTRY_TEMPLATE % (
+            entry["timestamp"],
+            entry["readable_time"].encode(),
+            entry["entry_number"],
+            json.dumps(entry["data"], separators=(',', ':')).encode()
+        )
+
 
 # Global variable for ultrasonic telemetry data saver
 ultrasonic_telemetry_saver = None
 
+# Guards creating, replacing and updating the saver; file I/O happens on its writer thread
+_saver_lock = threading.Lock()
+
+# Most recent entries (and their per-sensor value columns) kept in memory, so
+# summaries up to this size need no file I/O
+_RECENT_ENTRIES_MAX = 256
+
+# Last parsed summary tail as ((file_path, mtime_ns, size, limit), entries); any
+# append changes the file size, so a stale tail is never reused
+_summary_cache = (None, None)
+
+# Last formatted readable_time as (epoch second, string); formatted once per second
+_readable_time_cache = (None, "")
+
+# Entry dicts are reused in rotation instead of allocated per save. The pool is
+# larger than the recent-entries window, so a dict is only refilled after it has
+# left that window; summaries hand out copies.
+_ENTRY_POOL_SIZE = 4 * _RECENT_ENTRIES_MAX
+_entry_pool = itertools.cycle([
+    {"timestamp": 0.0, "readable_time": "", "entry_number": 0, "data": None}
+    for _ in range(_ENTRY_POOL_SIZE)
+])
+
+# The writer thread writes queued lines as one batch once this many are
+# queued, or at least this often
+_FLUSH_EVERY = 64
+_FLUSH_INTERVAL_SEC = 1.0
+
+# Queued line limit; beyond it the oldest lines are dropped
+_QUEUE_MAX_LINES = 4096
+
+# Where available, os.writev hands a batch to the kernel in one call without
+# joining it first; IOV_MAX bounds the lines per call
+_WRITEV_AVAILABLE = hasattr(os, "writev")
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX") if _WRITEV_AVAILABLE else 0
+except (ValueError, OSError):
+    _IOV_MAX = 0
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+def _write_lines(fd: int, batch):
+    """Write a batch of lines to a file descriptor, gathering them with writev when available"""
+    if not _WRITEV_AVAILABLE:
+        view = memoryview(b"".join(batch))
+        while view:
+            view = view[os.write(fd, view):]
+        return
+    
+    for start in range(0, len(batch), _IOV_MAX):
+        chunk = batch[start:start + _IOV_MAX]
+        written = os.writev(fd, chunk)
+        if written < sum(map(len, chunk)):
+            # Short write: finish the rest of this chunk with plain writes
+            view = memoryview(b"".join(chunk))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+
+
+# Summary keys and telemetry value keys for sensors 1-4 in sensor order
+_SENSOR_KEYS = tuple(f"sensor_{i}" for i in range(1, MAX_SENSORS + 1))
+_DISTANCE_KEYS = DISTANCE_KEYS[1:]
+_CONFIDENCE_KEYS = CONFIDENCE_KEYS[1:]
+_TEMP_COMP_KEYS = TEMP_COMP_KEYS[1:]
+
+
+def _average_columns(distance_columns, confidence_columns, temp_comp_columns):
+    """
+    Per-sensor averages from value columns, one column per sensor in sensor order.
+    None marks a reading missing from an entry.
+    """
+    avg_distances = {}
+    avg_confidences = {}
+    temp_compensated_count = 0
+    for sensor_key, distances, confidences, temp_comps in zip(
+            _SENSOR_KEYS, distance_columns, confidence_columns, temp_comp_columns):
+        distances = [distance for distance in distances if distance is not None]
+        if distances:
+            avg_distances[sensor_key] = round(statistics.fmean(distances), 1)
+        confidences = [confidence for confidence in confidences if confidence is not None]
+        if confidences:
+            avg_confidences[sensor_key] = round(statistics.fmean(confidences), 2)
+        temp_compensated_count += sum(1 for temp_comp in temp_comps if temp_comp)
+    
+    return avg_distances, avg_confidences, temp_compensated_count
+
+
+def _read_tail_lines(file_path: Path, limit: int, block_size: int = 64 * 1024):
+    """
+    Read the last `limit` lines of a JSON Lines file.
+    
+    Blocks are read backwards from the end until enough lines are found, so the
+    cost depends on `limit`, not on how large the file has grown.
+    """
+    if limit <= 0:
+        return []
+    
+    with open(file_path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        blocks = []
+        newlines = 0
+        # One newline more than `limit` guarantees the oldest kept line is complete
+        while pos > 0 and newlines <= limit:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            block = f.read(size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+    
+    lines = b"".join(reversed(blocks)).split(b"\n")
+    if pos > 0:
+        lines = lines[1:]  # Partial line before the first newline read
+    return [line for line in lines if line.strip()][-limit:]
+
+
+def _file_size(saver: Dict[str, Any]) -> int:
+    """Size the file will have once queued lines are written, without a syscall"""
+    with saver["write_lock"]:
+        return saver["offset"] + sum(map(len, tuple(saver["queue"])))
+
+
+def _write_pending(saver: Dict[str, Any]):
+    """
+    Write all queued lines to the file in one batch.
+    
+    A failed batch is counted in the saver's "failed" total (reported as
+    failed_entries) and the exception is re-raised for the caller to log.
+    """
+    with saver["write_lock"]:
+        lines = saver["queue"]
+        batch = saver["batch"]  # Reused across drains
+        while lines:
+            batch.append(lines.popleft())
+        
+        if batch:
+            fd = saver["file"].fileno()
+            try:
+                _write_lines(fd, batch)
+                saver["offset"] += sum(map(len, batch))
+            except Exception:
+                saver["failed"] += len(batch)
+                # Part of the batch may have reached the file; resync the offset
+                try:
+                    saver["offset"] = os.fstat(fd).st_size
+                except OSError:
+                    pass
+                raise
+            finally:
+                batch.clear()
+
+
+def _writer_loop(saver: Dict[str, Any]):
+    """Write queued lines until the saver is stopped, then write what is left"""
+    while not saver["stop"].is_set():
+        saver["wake"].wait(_FLUSH_INTERVAL_SEC)
+        saver["wake"].clear()
+        try:
+            _write_pending(saver)
+        except Exception as e:
+            print(f"❌ Error writing ultrasonic telemetry file: {e}")
+    _write_pending(saver)
+
+
+def _stop_writer(saver: Dict[str, Any]):
+    """Stop the saver's writer thread (it writes what is left) and close the file"""
+    saver["stop"].set()
+    saver["wake"].set()
+    saver["thread"].join()
+    saver["file"].close()
+
 
 def save_ultrasonic_telemetry_to_file(ultrasonic_data: Dict[str, Any], filename: Optional[str] = None) -> bool:
     """
-    Save ultrasonic telemetry data to JSON file in data/telemetry/
+    Save ultrasonic telemetry data to a JSON Lines file in data/telemetry/
     
     Args:
         ultrasonic_data: Dictionary containing ultrasonic telemetry data
@@ -26,62 +235,93 @@ def save_ultrasonic_telemetry_to_file(ultrasonic_data: Dict[str, Any], filename:
     Returns:
         True if saved successfully, False otherwise
     """
-    global ultrasonic_telemetry_saver
+    global ultrasonic_telemetry_saver, _readable_time_cache
     
     try:
-        # Initialize saver if not exists
-        if ultrasonic_telemetry_saver is None:
-            telemetry_dir = Path("data/telemetry")
-            telemetry_dir.mkdir(parents=True, exist_ok=True)
+        # One clock read per save, shared by the entry, the metadata and a new saver
+        now = time.time()
+        
+        # Saves from several threads are serialized here; entry numbers and the
+        # order of lines in the file follow the order saves take the lock
+        with _saver_lock:
+            # Initialize saver if not exists
+            if ultrasonic_telemetry_saver is None:
+                telemetry_dir = Path("data/telemetry")
+                telemetry_dir.mkdir(parents=True, exist_ok=True)
+                
+                if filename is None:
+                    timestamp = int(now)
+                    filename = f"api_ultrasonic_telemetry_{timestamp}.jsonl"
+                
+                file_path = telemetry_dir / filename
+                telemetry_file = open(file_path, 'ab', buffering=0)  # Kept open for appends; batching is done by the writer
+                ultrasonic_telemetry_saver = {
+                    "file_path": file_path,
+                    "filename": file_path.name,
+                    "file": telemetry_file,
+                    # End-of-file offset, advanced by the writer; O_APPEND places every write there
+                    "offset": telemetry_file.tell(),
+                    "queue": collections.deque(maxlen=_QUEUE_MAX_LINES),
+                    "batch": [],  # Writer's batch list, allocated once for the life of the file
+                    "write_lock": threading.Lock(),
+                    "wake": threading.Event(),
+                    "stop": threading.Event(),
+                    "recent": collections.deque(maxlen=_RECENT_ENTRIES_MAX),
+                    # Value columns for the recent entries, one deque per sensor
+                    "distance_columns": [collections.deque(maxlen=_RECENT_ENTRIES_MAX) for _ in range(MAX_SENSORS)],
+                    "confidence_columns": [collections.deque(maxlen=_RECENT_ENTRIES_MAX) for _ in range(MAX_SENSORS)],
+                    "temp_comp_columns": [collections.deque(maxlen=_RECENT_ENTRIES_MAX) for _ in range(MAX_SENSORS)],
+                    "entries": 0,
+                    "dropped": 0,
+                    "failed": 0,  # Lines lost to failed writes, counted by the writer
+                    "start_time": now,
+                    "last_save_time": now
+                }
+                ultrasonic_telemetry_saver["thread"] = threading.Thread(
+                    target=_writer_loop, args=(ultrasonic_telemetry_saver,),
+                    name="ultrasonic-file-writer", daemon=True
+                )
+                ultrasonic_telemetry_saver["thread"].start()
+                
+                print(f"📁 Ultrasonic telemetry file created: {filename}")
             
-            if filename is None:
-                timestamp = int(time.time())
-                filename = f"api_ultrasonic_telemetry_{timestamp}.json"
+            saver = ultrasonic_telemetry_saver
+            entries = saver["entries"] + 1
             
-            file_path = telemetry_dir / filename
-            ultrasonic_telemetry_saver = {
-                "file_path": file_path,
-                "entries": 0,
-                "start_time": time.time(),
-                "last_save_time": time.time()
-            }
+            # Create telemetry entry with metadata (readable_time reformatted once per second)
+            second = int(now)
+            if _readable_time_cache[0] != second:
+                _readable_time_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+            telemetry_entry = next(_entry_pool)
+            telemetry_entry["timestamp"] = now
+            telemetry_entry["readable_time"] = _readable_time_cache[1]
+            telemetry_entry["entry_number"] = entries
+            telemetry_entry["data"] = ultrasonic_data
             
-            # Initialize file with empty array
-            with open(file_path, 'w') as f:
-                json.dump([], f)
+            # Queue one line for the writer thread; a full queue drops its oldest line
+            lines = saver["queue"]
+            if len(lines) == _QUEUE_MAX_LINES:
+                saver["dropped"] += 1
+            lines.append(_encode_line(telemetry_entry))
+            if len(lines) >= _FLUSH_EVERY:
+                saver["wake"].set()
+            saver["recent"].append(telemetry_entry)
+            values_get = (ultrasonic_data.get("values") or {}).get
+            for column, key in zip(saver["distance_columns"], _DISTANCE_KEYS):
+                column.append(values_get(key))
+            for column, key in zip(saver["confidence_columns"], _CONFIDENCE_KEYS):
+                column.append(values_get(key))
+            for column, key in zip(saver["temp_comp_columns"], _TEMP_COMP_KEYS):
+                column.append(values_get(key))
             
-            print(f"📁 Ultrasonic telemetry file created: {filename}")
-        
-        # Read existing data
-        try:
-            with open(ultrasonic_telemetry_saver["file_path"], 'r') as f:
-                existing_data = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            existing_data = []
-        
-        # Create telemetry entry with metadata
-        telemetry_entry = {
-            "timestamp": time.time(),
-            "readable_time": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "entry_number": ultrasonic_telemetry_saver["entries"] + 1,
-            "data": ultrasonic_data
-        }
-        
-        # Append new entry
-        existing_data.append(telemetry_entry)
-        
-        # Write back to file
-        with open(ultrasonic_telemetry_saver["file_path"], 'w') as f:
-            json.dump(existing_data, f, indent=2)
-        
-        # Update metadata
-        ultrasonic_telemetry_saver["entries"] += 1
-        ultrasonic_telemetry_saver["last_save_time"] = time.time()
-        
-        # Log every 10 entries to avoid spam
-        if ultrasonic_telemetry_saver["entries"] % 10 == 0:
-            print(f"💾 Ultrasonic telemetry saved: {ultrasonic_telemetry_saver['entries']} entries to {ultrasonic_telemetry_saver['file_path'].name}")
-        
+            # Update metadata
+            saver["entries"] = entries
+            saver["last_save_time"] = now
+            
+            # Log every 10 entries to avoid spam
+            if entries % 10 == 0:
+                print(f"💾 Ultrasonic telemetry saved: {entries} entries to {saver['filename']}")
+
         return True
         
     except Exception as e:
@@ -89,6 +329,28 @@ def save_ultrasonic_telemetry_to_file(ultrasonic_data: Dict[str, Any], filename:
         return False
 
 
+def flush_ultrasonic_telemetry_file() -> bool:
+    """
+    Flush the ultrasonic telemetry file and sync it to disk
+    
+    Returns:
+        True if flushed successfully, False otherwise
+    """
+    global ultrasonic_telemetry_saver
+    
+    if ultrasonic_telemetry_saver is None:
+        return False
+    
+    try:
+        _write_pending(ultrasonic_telemetry_saver)
+        with ultrasonic_telemetry_saver["write_lock"]:
+            os.fsync(ultrasonic_telemetry_saver["file"].fileno())
+        return True
+    except Exception as e:
+        print(f"❌ Error flushing ultrasonic telemetry file: {e}")
+        return False
+
+
 def get_ultrasonic_telemetry_file_status() -> Dict[str, Any]:
     """
     Get the current status of ultrasonic telemetry file saving
@@ -105,14 +367,17 @@ def get_ultrasonic_telemetry_file_status() -> Dict[str, Any]:
         }
     
     try:
-        file_size = ultrasonic_telemetry_saver["file_path"].stat().st_size
+        # Includes queued entries
+        file_size = _file_size(ultrasonic_telemetry_saver)
         uptime = time.time() - ultrasonic_telemetry_saver["start_time"]
         
         return {
             "file_active": True,
             "file_path": str(ultrasonic_telemetry_saver["file_path"]),
-            "filename": ultrasonic_telemetry_saver["file_path"].name,
+            "filename": ultrasonic_telemetry_saver["filename"],
             "total_entries": ultrasonic_telemetry_saver["entries"],
+            "dropped_entries": ultrasonic_telemetry_saver["dropped"],
+            "failed_entries": ultrasonic_telemetry_saver["failed"],
             "file_size_bytes": file_size,
             "file_size_kb": round(file_size / 1024, 2),
             "uptime_seconds": round(uptime, 1),
@@ -139,14 +404,16 @@ def reset_ultrasonic_telemetry_file() -> Dict[str, Any]:
     global ultrasonic_telemetry_saver
     
     try:
-        # Close current file if exists
-        if ultrasonic_telemetry_saver is not None:
-            old_entries = ultrasonic_telemetry_saver["entries"]
-            old_filename = ultrasonic_telemetry_saver["file_path"].name
-            print(f"📁 Closing ultrasonic telemetry file: {old_filename} ({old_entries} entries)")
+        # Reset global variable; the next save creates a new file
+        with _saver_lock:
+            old_saver = ultrasonic_telemetry_saver
+            ultrasonic_telemetry_saver = None
         
-        # Reset global variable
-        ultrasonic_telemetry_saver = None
+        # Close current file if exists
+        if old_saver is not None:
+            old_entries = old_saver["entries"]
+            _stop_writer(old_saver)
+            print(f"📁 Closing ultrasonic telemetry file: {old_saver['filename']} ({old_entries} entries)")
         
         # Create new file on next save
         return {
@@ -168,12 +435,12 @@ def get_ultrasonic_telemetry_summary(limit: int = 10) -> Dict[str, Any]:
     Get summary of recent ultrasonic telemetry entries
     
     Args:
-        limit: Number of recent entries to include in summary
+        limit: Number of recent entries to include in summary; 0 includes every entry
         
     Returns:
         Dictionary containing telemetry summary
     """
-    global ultrasonic_telemetry_saver
+    global ultrasonic_telemetry_saver, _summary_cache
     
     if ultrasonic_telemetry_saver is None:
         return {
@@ -182,56 +449,70 @@ def get_ultrasonic_telemetry_summary(limit: int = 10) -> Dict[str, Any]:
         }
     
     try:
-        with open(ultrasonic_telemetry_saver["file_path"], 'r') as f:
-            all_data = json.load(f)
+        if 0 < limit <= _RECENT_ENTRIES_MAX:
+            # Served from the in-memory entries, copied under the save lock so the
+            # entries and value columns come from the same set of saves
+            with _saver_lock:
+                saver = ultrasonic_telemetry_saver
+                if saver is None:
+                    return {
+                        "summary_available": False,
+                        "message": "No ultrasonic telemetry file active"
+                    }
+                recent = saver["recent"]
+                skip = max(len(recent) - limit, 0)
+                recent_entries = [dict(entry) for entry in itertools.islice(recent, skip, None)]  # Pooled dicts are reused later
+                columns = [
+                    [list(itertools.islice(column, skip, None)) for column in saver[name]]
+                    for name in ("distance_columns", "confidence_columns", "temp_comp_columns")
+                ]
+                total_entries = saver["entries"]
+            # The file size is the append position plus queued lines
+            file_size = _file_size(saver)
+        else:
+            # Queued entries must be in the file before its tail is read
+            _write_pending(ultrasonic_telemetry_saver)
+            file_path = ultrasonic_telemetry_saver["file_path"]
+            file_stat = file_path.stat()
+            file_size = file_stat.st_size
+            cache_key = (file_path, file_stat.st_mtime_ns, file_size, limit)
+            
+            cached_key, cached_entries = _summary_cache
+            if cached_key == cache_key:
+                recent_entries = list(cached_entries)
+            else:
+                if limit > 0:
+                    # Only the last `limit` lines are read and parsed
+                    recent_lines = _read_tail_lines(file_path, limit)
+                else:
+                    # Whole file, sliced as entries[-limit:] (so 0 keeps every entry)
+                    recent_lines = [line for line in file_path.read_bytes().split(b"\n") if line.strip()][-limit:]
+                recent_entries = [_decode_entry(line) for line in recent_lines]
+                _summary_cache = (cache_key, tuple(recent_entries))
+            
+            # Value columns from the parsed entries
+            rows = [entry["data"]["values"] for entry in recent_entries
+                    if "data" in entry and "values" in entry["data"]]
+            columns = [
+                [[values.get(key) for values in rows] for key in keys]
+                for keys in (_DISTANCE_KEYS, _CONFIDENCE_KEYS, _TEMP_COMP_KEYS)
+            ]
+            saver = ultrasonic_telemetry_saver
+            total_entries = saver["entries"]
         
-        if not all_data:
+        if not recent_entries:
             return {
                 "summary_available": False,
                 "message": "No ultrasonic telemetry data available"
             }
         
-        # Get recent entries
-        recent_entries = all_data[-limit:] if len(all_data) >= limit else all_data
-        
-        # Calculate statistics
-        total_entries = len(all_data)
-        file_size = ultrasonic_telemetry_saver["file_path"].stat().st_size
-        
-        # Extract sensor data for analysis
-        sensor_distances = {f"sensor_{i}": [] for i in range(1, 5)}
-        sensor_confidences = {f"sensor_{i}": [] for i in range(1, 5)}
-        temp_compensated_count = 0
-        
-        for entry in recent_entries:
-            if "data" in entry and "values" in entry["data"]:
-                values = entry["data"]["values"]
-                for sensor_id in range(1, 5):
-                    distance_key = f"ultrasonic.sensor_{sensor_id}.distance_cm"
-                    confidence_key = f"ultrasonic.sensor_{sensor_id}.confidence"
-                    temp_comp_key = f"ultrasonic.sensor_{sensor_id}.temperature_compensated"
-                    
-                    if distance_key in values:
-                        sensor_distances[f"sensor_{sensor_id}"].append(values[distance_key])
-                    if confidence_key in values:
-                        sensor_confidences[f"sensor_{sensor_id}"].append(values[confidence_key])
-                    if temp_comp_key in values and values[temp_comp_key]:
-                        temp_compensated_count += 1
-        
-        # Calculate averages
-        avg_distances = {}
-        avg_confidences = {}
-        for sensor_id in range(1, 5):
-            sensor_key = f"sensor_{sensor_id}"
-            if sensor_distances[sensor_key]:
-                avg_distances[sensor_key] = round(sum(sensor_distances[sensor_key]) / len(sensor_distances[sensor_key]), 1)
-            if sensor_confidences[sensor_key]:
-                avg_confidences[sensor_key] = round(sum(sensor_confidences[sensor_key]) / len(sensor_confidences[sensor_key]), 2)
+        # Calculate averages one sensor column at a time
+        avg_distances, avg_confidences, temp_compensated_count = _average_columns(*columns)
         
         return {
             "summary_available": True,
             "file_status": {
-                "filename": ultrasonic_telemetry_saver["file_path"].name,
+                "filename": saver["filename"],
                 "total_entries": total_entries,
                 "file_size_kb": round(file_size / 1024, 2),
                 "recent_entries_analyzed": len(recent_entries)
@@ -251,3 +532,72 @@ def get_ultrasonic_telemetry_summary(limit: int = 10) -> Dict[str, Any]:
             "error": str(e),
             "message": "Failed to generate ultrasonic telemetry summary"
         }
+
+
+def export_ultrasonic_telemetry_pretty(output_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Export the current ultrasonic telemetry file as an indented JSON array for reading
+    
+    Saving writes compact JSON Lines; this is the on-demand human-readable form.
+    
+    Args:
+        output_path: Optional destination, defaults to the telemetry file with a .json suffix
+        
+    Returns:
+        Dictionary containing export result
+    """
+    global ultrasonic_telemetry_saver
+    
+    if ultrasonic_telemetry_saver is None:
+        return {
+            "success": False,
+            "message": "No ultrasonic telemetry file active"
+        }
+    
+    try:
+        source_path = ultrasonic_telemetry_saver["file_path"]
+        export_path = Path(output_path) if output_path else source_path.with_suffix(".json")
+        
+        # Entries are streamed one line at a time, so only one is held in memory;
+        # the output matches json.dumps(entries, indent=2). It is written to a
+        # sibling file and moved into place, so a crash never leaves a partial export.
+        _write_pending(ultrasonic_telemetry_saver)
+        exported = 0
+        staging_path = export_path.with_name(export_path.name + ".tmp")
+        with open(source_path, 'rb') as source, open(staging_path, 'w') as f:
+            for line in source:
+                if not line.strip():
+                    continue
+                f.write(",\n  " if exported else "[\n  ")
+                f.write(json.dumps(_decode_entry(line), indent=2).replace("\n", "\n  "))
+                exported += 1
+            f.write("\n]" if exported else "[]")
+        os.replace(staging_path, export_path)
+        
+        print(f"📄 Ultrasonic telemetry exported: {exported} entries to {export_path.name}")
+        
+        return {
+            "success": True,
+            "export_path": str(export_path),
+            "entries_exported": exported
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "Failed to export ultrasonic telemetry file"
+        }
+
+
+def _close_ultrasonic_telemetry_file():
+    """Write out queued entries and close the file at interpreter exit"""
+    global ultrasonic_telemetry_saver
+    with _saver_lock:
+        saver = ultrasonic_telemetry_saver
+        ultrasonic_telemetry_saver = None
+    if saver is not None:
+        _stop_writer(saver)
+
+
+atexit.register(_close_ultrasonic_telemetry_file)
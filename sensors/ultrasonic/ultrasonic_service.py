@@ -5,9 +5,138 @@ This module manages the operational state and configuration of ultrasonic sensor
 for distance measurement and obstacle detection.
 """
 
+import functools
+import json
+import queue
+import sys
 import threading
 import time
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
+
+from .sensor_keys import DISTANCE_KEYS
+
+# orjson is optional; it encodes straight to compact bytes with the newline appended
+try:
+    import orjson
+    
+    def _encode_sample_line(entry: Dict[str, Any]) -> bytes:
+        """Encode a capture sample as one compact JSON line with orjson"""
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    orjson = None
+    
+    def _encode_sample_line(entry: Dict[str, Any]) -> bytes:
+        """Encode a capture sample as one compact JSON line with the stdlib encoder"""
+        return json.dumps(entry, separators=(',', ':')).encode() + b"\n"
+
+
+# Capture-loop status lines are collected and written to stdout at most this often
+_LOG_FLUSH_INTERVAL_SEC = 1.0
+
+# Session file buffer size and how many samples are appended between flushes
+_SESSION_BUFFER_SIZE = 1 << 20
+_SESSION_FLUSH_EVERY = 64
+
+# Encoded samples waiting for the session writer thread; samples are dropped when full
+_WRITE_QUEUE_MAX = 256
+
+# Longest wait for the session writer to drain its queue and finish
+_WRITER_STOP_TIMEOUT_SEC = 10.0
+
+# How often an idle session writer checks whether it has been stopped
+_WRITER_POLL_SEC = 0.1
+
+
+# Package-level telemetry accessor, resolved on first use (the package imports this module)
+_get_ultrasonic_telemetry_data = None
+
+
+def _telemetry_data_getter():
+    """Return the package's get_ultrasonic_telemetry_data function"""
+    global _get_ultrasonic_telemetry_data
+    if _get_ultrasonic_telemetry_data is None:
+        from . import get_ultrasonic_telemetry_data as _get_ultrasonic_telemetry_data
+    return _get_ultrasonic_telemetry_data
+
+
+def _session_writer(session_file, write_queue: queue.Queue, stop: threading.Event,
+                    errors: List[Exception]):
+    """
+    Append queued sample lines to the session file until stopped and drained,
+    then close the file.
+    
+    Errors are collected rather than raised so the thread keeps draining the
+    queue and the capture loop never blocks on a full queue. The writer owns
+    the file: it is only closed here, never while a write may be in progress.
+    """
+    written = 0
+    try:
+        while True:
+            try:
+                line = write_queue.get(timeout=_WRITER_POLL_SEC)
+            except queue.Empty:
+                if stop.is_set():
+                    break
+                continue
+            try:
+                session_file.write(line)
+                written += 1
+                if written % _SESSION_FLUSH_EVERY == 0:
+                    session_file.flush()
+            except Exception as write_error:
+                errors.append(write_error)
+    finally:
+        try:
+            session_file.close()
+        except Exception as close_error:
+            errors.append(close_error)
+
+
+def _stop_session_writer(writer: threading.Thread, stop: threading.Event) -> bool:
+    """
+    Stop the session writer and wait for it to drain its queue and close the file.
+    
+    Returns:
+        True if the writer has finished, False if it did not within the timeout
+        (it keeps running as a daemon and closes the file when done)
+    """
+    stop.set()
+    writer.join(_WRITER_STOP_TIMEOUT_SEC)
+    return not writer.is_alive()
+
+
+def _write_log_lines(lines: List[str]):
+    """Write collected status lines with a single stdout write and clear the list"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    lines.clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _estimate_capture_session(sample_rate_hz: float, capture_duration_seconds: int,
+                              sensors_enabled: int) -> Dict[str, Any]:
+    """
+    Compute capture session estimates for a sample rate, duration and sensor count.
+    
+    Results are cached; callers must copy the returned dictionary before handing it out.
+    """
+    estimated_samples = int(capture_duration_seconds * sample_rate_hz)
+    estimated_distance_readings = estimated_samples * sensors_enabled
+    
+    # Estimate file size (approximate)
+    telemetry_size_per_sample = 700  # ~700B per compact ultrasonic telemetry JSONL line
+    estimated_total_size_mb = (estimated_samples * telemetry_size_per_sample) / (1024 * 1024)
+    
+    return {
+        "estimated_samples": estimated_samples,
+        "estimated_distance_readings": estimated_distance_readings,
+        "sensors_enabled": sensors_enabled,
+        "sample_rate_hz": sample_rate_hz,
+        "sample_interval_seconds": 1.0 / sample_rate_hz,
+        "estimated_telemetry_files": 1 if estimated_samples else 0,
+        "estimated_telemetry_size_mb": round(estimated_total_size_mb, 3),
+        "capture_efficiency": 100.0  # Ultrasonic captures continuously
+    }
 
 
 class UltrasonicControlService:
@@ -16,6 +145,16 @@ class UltrasonicControlService:
     configuration management, and operational state tracking.
     """
     
+    # Config key -> (type cast, min, max); bounds of None mean no range check
+    _CONFIG_SCHEMA = {
+        "sensors_enabled": (int, 1, 4),
+        "sample_rate_hz": (float, 0.1, 100.0),
+        "max_range_cm": (float, 10, 500),
+        "min_range_cm": (float, 1, 50),
+        "temperature_compensation": (bool, None, None),
+        "noise_filtering": (bool, None, None)
+    }
+    
     def __init__(self):
         """Initialize the ultrasonic control service."""
         self._lock = threading.RLock()
@@ -28,8 +167,24 @@ class UltrasonicControlService:
             "temperature_compensation": True,
             "noise_filtering": True
         }
+        # Read-only copy of _config, rebuilt only when the configuration changes,
+        # and the generation parameters (config plus active flag) read without the lock
+        self._config_snapshot = None
+        self._gen_params = None
+        self._publish_config()
         self._start_time = None
+        # Monotonic start time for uptime; _start_time stays wall-clock for the API
+        self._started_monotonic = None
         self._status = "initialized"
+    
+    def _publish_config(self):
+        """Rebuild the read-only config snapshot (call with _lock held)"""
+        self._config_snapshot = MappingProxyType(dict(self._config))
+        self._publish_gen_params()
+    
+    def _publish_gen_params(self):
+        """Rebuild the read-only generation parameters (call with _lock held)"""
+        self._gen_params = MappingProxyType({"active": self._active, **self._config_snapshot})
         
     def start(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -48,7 +203,7 @@ class UltrasonicControlService:
                         "success": False,
                         "active": True,
                         "message": "Ultrasonic sensors already active",
-                        "config": self._config.copy()
+                        "config": dict(self._config_snapshot)
                     }
                 
                 # Apply new configuration if provided
@@ -56,7 +211,9 @@ class UltrasonicControlService:
                     self._apply_config(config)
                 
                 self._active = True
+                self._publish_gen_params()
                 self._start_time = time.time()
+                self._started_monotonic = time.monotonic()
                 self._status = "operational"
                 
                 print(f"🔊 Ultrasonic Control Service started")
@@ -69,7 +226,7 @@ class UltrasonicControlService:
                     "success": True,
                     "active": True,
                     "message": "Ultrasonic sensors started successfully",
-                    "config": self._config.copy(),
+                    "config": dict(self._config_snapshot),
                     "start_time": self._start_time
                 }
                 
@@ -99,9 +256,10 @@ class UltrasonicControlService:
                         "message": "Ultrasonic sensors not active"
                     }
                 
-                uptime = time.time() - self._start_time if self._start_time else 0
+                uptime = time.monotonic() - self._started_monotonic if self._started_monotonic else 0
                 
                 self._active = False
+                self._publish_gen_params()
                 self._status = "stopped"
                 
                 print(f"🔇 Ultrasonic Control Service stopped")
@@ -147,6 +305,7 @@ class UltrasonicControlService:
                     "temperature_compensation": True,
                     "noise_filtering": True
                 }
+                self._publish_config()
                 self._status = "reset"
                 
                 print(f"🔄 Ultrasonic Control Service reset to defaults")
@@ -155,7 +314,7 @@ class UltrasonicControlService:
                     "success": True,
                     "active": False,
                     "message": "Ultrasonic sensors reset to default configuration",
-                    "config": self._config.copy(),
+                    "config": dict(self._config_snapshot),
                     "was_active": was_active
                 }
                 
@@ -174,20 +333,25 @@ class UltrasonicControlService:
         """
         Get the current operational state and configuration.
         
+        Reads without the lock: each field is a single attribute replaced by
+        the writers, so a call racing start/stop may mix the old and new state.
+        
         Returns:
             Dictionary containing current state information
         """
-        with self._lock:
-            uptime = time.time() - self._start_time if self._start_time and self._active else 0
-            
-            return {
-                "active": self._active,
-                "status": self._status,
-                "config": self._config.copy(),
-                "uptime_seconds": round(uptime, 1) if self._active else 0,
-                "start_time": self._start_time,
-                "sensors_operational": self._config["sensors_enabled"] if self._active else 0
-            }
+        active = self._active
+        started_monotonic = self._started_monotonic
+        config = self._config_snapshot
+        uptime = time.monotonic() - started_monotonic if active and started_monotonic else 0
+        
+        return {
+            "active": active,
+            "status": self._status,
+            "config": dict(config),
+            "uptime_seconds": round(uptime, 1) if active else 0,
+            "start_time": self._start_time,
+            "sensors_operational": config["sensors_enabled"] if active else 0
+        }
     
     def apply_config(self, **kwargs) -> Dict[str, Any]:
         """
@@ -200,9 +364,9 @@ class UltrasonicControlService:
             Dictionary containing applied configuration
         """
         with self._lock:
-            return self._apply_config(kwargs)
+            return dict(self._apply_config(kwargs))
     
-    def _apply_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _apply_config(self, config: Dict[str, Any]) -> Mapping[str, Any]:
         """
         Internal method to apply configuration.
         
@@ -210,67 +374,49 @@ class UltrasonicControlService:
             config: Configuration dictionary
             
         Returns:
-            Applied configuration
+            Read-only snapshot of the applied configuration
         """
-        if "sensors_enabled" in config:
-            sensors_enabled = int(config["sensors_enabled"])
-            if 1 <= sensors_enabled <= 4:
-                self._config["sensors_enabled"] = sensors_enabled
-            else:
-                raise ValueError(f"sensors_enabled must be between 1 and 4, got {sensors_enabled}")
+        # Fast path: nothing to apply when every requested value matches the current config
+        if not self._config_differs(config):
+            return self._config_snapshot
         
-        if "sample_rate_hz" in config:
-            sample_rate = float(config["sample_rate_hz"])
-            if 0.1 <= sample_rate <= 100.0:
-                self._config["sample_rate_hz"] = sample_rate
-            else:
-                raise ValueError(f"sample_rate_hz must be between 0.1 and 100.0, got {sample_rate}")
-        
-        if "max_range_cm" in config:
-            max_range = float(config["max_range_cm"])
-            if 10 <= max_range <= 500:
-                self._config["max_range_cm"] = max_range
-            else:
-                raise ValueError(f"max_range_cm must be between 10 and 500, got {max_range}")
-        
-        if "min_range_cm" in config:
-            min_range = float(config["min_range_cm"])
-            if 1 <= min_range <= 50:
-                self._config["min_range_cm"] = min_range
-            else:
-                raise ValueError(f"min_range_cm must be between 1 and 50, got {min_range}")
+        # Validate into a copy so a rejected update leaves the current config intact
+        updated = dict(self._config)
         
-        if "temperature_compensation" in config:
-            self._config["temperature_compensation"] = bool(config["temperature_compensation"])
-        
-        if "noise_filtering" in config:
-            self._config["noise_filtering"] = bool(config["noise_filtering"])
+        for key, (cast, low, high) in self._CONFIG_SCHEMA.items():
+            if key in config:
+                value = cast(config[key])
+                if low is not None and not low <= value <= high:
+                    raise ValueError(f"{key} must be between {low} and {high}, got {value}")
+                updated[key] = value
         
         # Validate min < max range
-        if self._config["min_range_cm"] >= self._config["max_range_cm"]:
+        if updated["min_range_cm"] >= updated["max_range_cm"]:
             raise ValueError("min_range_cm must be less than max_range_cm")
         
+        self._config = updated
+        self._publish_config()
         print(f"🔧 Ultrasonic configuration updated: {config}")
         
-        return self._config.copy()
+        return self._config_snapshot
+    
+    def _config_differs(self, config: Dict[str, Any]) -> bool:
+        """Check whether applying config would change the current configuration"""
+        current = self._config
+        return any(key in current and current[key] != value for key, value in config.items())
     
-    def get_effective_generation_params(self) -> Dict[str, Any]:
+    def get_effective_generation_params(self) -> Mapping[str, Any]:
         """
         Get the effective parameters for telemetry data generation.
         
+        The returned mapping is shared and read-only; it is swapped whole on
+        every change, so it is read without the lock and "active" may trail a
+        concurrent start/stop by one call. Use ``dict()`` if a mutable copy is needed.
+        
         Returns:
-            Dictionary containing effective generation parameters
+            Mapping containing effective generation parameters
         """
-        with self._lock:
-            return {
-                "active": self._active,
-                "sensors_enabled": self._config["sensors_enabled"],
-                "sample_rate_hz": self._config["sample_rate_hz"],
-                "max_range_cm": self._config["max_range_cm"],
-                "min_range_cm": self._config["min_range_cm"],
-                "temperature_compensation": self._config["temperature_compensation"],
-                "noise_filtering": self._config["noise_filtering"]
-            }
+        return self._gen_params
 
     def timed_ultrasonic_capture(
         self,
@@ -285,12 +431,12 @@ class UltrasonicControlService:
         Perform timed ultrasonic data capture for a specified duration.
         
         This method captures ultrasonic telemetry data at the specified sample rate
-        for the given duration and saves it to JSON files.
+        for the given duration and appends it to a single JSONL session file.
         
         Args:
             sample_rate_hz (float): Sample rate in Hz (how frequently to capture data)
             capture_duration_seconds (int): Total duration to capture data (in seconds)
-            save_location (str): Directory path where telemetry JSON files should be saved
+            save_location (str): Directory path where the telemetry JSONL file should be saved
             device_id (str, optional): Device identifier for file naming
             stop_event (threading.Event, optional): Event to signal early termination
             capture_params (dict, optional): Additional ultrasonic capture parameters
@@ -300,7 +446,10 @@ class UltrasonicControlService:
                 {
                     "success": bool,
                     "samples_captured": int,
-                    "telemetry_files": List[str],
+                    "samples_dropped": int (write queue was full),
+                    "samples_not_written": int (failed writes or still queued when the writer timed out),
+                    "duplicate_samples_skipped": int (repeated readings not stored),
+                    "telemetry_files": List[str] (the session JSONL file),
                     "capture_duration_actual": float,
                     "total_distance_readings": int,
                     "avg_distance_cm": float,
@@ -320,6 +469,9 @@ class UltrasonicControlService:
                 "success": False,
                 "error": f"Invalid sample rate: {sample_rate_hz}Hz. Must be between 0.1 and 100.0 Hz",
                 "samples_captured": 0,
+                "samples_dropped": 0,
+                "samples_not_written": 0,
+                "duplicate_samples_skipped": 0,
                 "telemetry_files": [],
                 "capture_duration_actual": 0.0,
                 "total_distance_readings": 0,
@@ -331,6 +483,9 @@ class UltrasonicControlService:
         results = {
             "success": False,
             "samples_captured": 0,
+            "samples_dropped": 0,
+            "samples_not_written": 0,
+            "duplicate_samples_skipped": 0,
             "telemetry_files": [],
             "capture_duration_actual": 0.0,
             "total_distance_readings": 0,
@@ -364,7 +519,7 @@ class UltrasonicControlService:
             was_originally_active = original_state["active"]
             
             # Configure ultrasonic with capture parameters
-            if capture_params or sample_rate_hz != self._config.get("sample_rate_hz", 10.0):
+            if self._config_differs(default_params):
                 print(f"🔧 Applying ultrasonic configuration: sample_rate_hz={sample_rate_hz}")
                 try:
                     self.apply_config(**default_params)
@@ -379,6 +534,9 @@ class UltrasonicControlService:
                         "success": False,
                         "error": "Failed to start ultrasonic sensors for capture session",
                         "samples_captured": 0,
+                        "samples_dropped": 0,
+                        "samples_not_written": 0,
+                        "duplicate_samples_skipped": 0,
                         "telemetry_files": [],
                         "capture_duration_actual": 0.0,
                         "total_distance_readings": 0,
@@ -399,27 +557,64 @@ class UltrasonicControlService:
             print(f"   Expected samples: {expected_samples}")
             print(f"   Sensors enabled: {self._config['sensors_enabled']}")
             
-            # Track timing and data
+            # Distance keys of the enabled sensors, fixed for the session
+            distance_keys = DISTANCE_KEYS[1:self._config["sensors_enabled"] + 1]
+            
+            # Track timing and data; the wall clock only names the file and stamps entries,
+            # pacing and the duration check use the monotonic clock
             start_time = time.time()
-            captured_files = []
-            total_distances = []
+            start_monotonic = time.monotonic()
+            distance_sum = 0.0
+            distance_count = 0
+            
+            # All samples of the session are appended to one JSONL file
+            session_path = save_dir / f"ultrasonic_session_{int(start_time * 1000)}.jsonl"
+            session_file = open(session_path, 'ab', buffering=_SESSION_BUFFER_SIZE)
+            
+            # Bind the per-sample callables to locals once for the loop
+            get_ultrasonic_telemetry_data = _telemetry_data_getter()
+            monotonic = time.monotonic
+            time_ns = time.time_ns
+            sleep = time.sleep
+            encode_sample = _encode_sample_line
+            
+            # Lines are appended by a writer thread so file I/O stays off the sampling thread
+            write_queue = queue.Queue(maxsize=_WRITE_QUEUE_MAX)
+            writer_stop = threading.Event()
+            write_errors = []
+            writer = threading.Thread(
+                target=_session_writer, args=(session_file, write_queue, writer_stop, write_errors),
+                name="ultrasonic-capture-writer", daemon=True
+            )
+            writer.start()
+            queue_sample = write_queue.put_nowait
+            samples_dropped = 0
             
-            # Import telemetry functions
-            from .telemetry_file_saver import save_ultrasonic_telemetry_to_file
-            from . import get_ultrasonic_telemetry_data
+            # Previous reading, to skip samples the source has not refreshed
+            last_values = None
+            duplicates_skipped = 0
+            
+            # Readable timestamp is only reformatted when the second changes
+            last_second = -1
+            readable_time = ""
+            
+            # Loop status lines are batched so console I/O does not stall the sample cadence
+            log_lines = []
+            log = log_lines.append
+            last_log_flush = start_monotonic
             
             sample_count = 0
+            next_tick = start_monotonic
             while True:
-                current_time = time.time()
-                elapsed_time = current_time - start_time
+                elapsed_time = monotonic() - start_monotonic
                 
                 # Check if we should stop
                 if elapsed_time >= capture_duration_seconds:
-                    print(f"⏰ Capture duration reached: {elapsed_time:.2f}s")
+                    log(f"⏰ Capture duration reached: {elapsed_time:.2f}s")
                     break
                     
                 if stop_event and stop_event.is_set():
-                    print(f"🛑 Stop event triggered at {elapsed_time:.2f}s")
+                    log(f"🛑 Stop event triggered at {elapsed_time:.2f}s")
                     break
                 
                 try:
@@ -429,58 +624,107 @@ class UltrasonicControlService:
                     if ultrasonic_data and "values" in ultrasonic_data:
                         sample_count += 1
                         
-                        # Save telemetry data to JSON file
-                        timestamp = int(time.time() * 1000)
-                        telemetry_filename = f"ultrasonic_telemetry_{timestamp}.json"
-                        telemetry_path = save_dir / telemetry_filename
-                        
-                        # Save with timestamp wrapper
-                        telemetry_entry = {
-                            "timestamp": time.time(),
-                            "readable_time": time.strftime("%Y-%m-%d %H:%M:%S"),
-                            "device_id": device_id,
-                            "sample_number": sample_count,
-                            "sample_rate_hz": sample_rate_hz,
-                            "data": ultrasonic_data
-                        }
-                        
-                        with open(telemetry_path, 'w') as f:
-                            import json
-                            json.dump(telemetry_entry, f, indent=2)
-                        
-                        captured_files.append(str(telemetry_path))
-                        results["samples_captured"] += 1
+                        # A source that has not refreshed hands back the previous reading,
+                        # possibly re-stamped with a new ts, so only the values are compared
+                        values = ultrasonic_data["values"]
+                        duplicate = values == last_values
+                        last_values = values
                         
-                        # Extract distance readings for statistics
-                        values = ultrasonic_data.get("values", {})
-                        for sensor_id in range(1, self._config["sensors_enabled"] + 1):
-                            distance = values.get(f"ultrasonic.sensor_{sensor_id}.distance_cm", 0)
-                            if distance > 0:
-                                total_distances.append(distance)
-                        
-                        if sample_count % 10 == 0:
-                            sensor_distances = [values.get(f"ultrasonic.sensor_{i}.distance_cm", 0) 
-                                             for i in range(1, self._config["sensors_enabled"] + 1)]
-                            print(f"🔊 Ultrasonic: {sample_count} samples captured, distances: {sensor_distances}")
+                        if duplicate:
+                            duplicates_skipped += 1
+                        else:
+                            now_ns = time_ns()
+                            current_time = now_ns / 1e9
+                            second = now_ns // 1_000_000_000
+                            if second != last_second:
+                                readable_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+                                last_second = second
+                            
+                            # Save with timestamp wrapper
+                            telemetry_entry = {
+                                "timestamp": current_time,
+                                "readable_time": readable_time,
+                                "device_id": device_id,
+                                "sample_number": sample_count,
+                                "sample_rate_hz": sample_rate_hz,
+                                "data": ultrasonic_data
+                            }
+                            
+                            # Hand one line per sample to the session writer
+                            try:
+                                queue_sample(encode_sample(telemetry_entry))
+                            except queue.Full:
+                                samples_dropped += 1
+                                log(f"⚠️ Ultrasonic write queue full, sample {sample_count} dropped")
+                            else:
+                                results["samples_captured"] += 1
+                                
+                                # Extract distance readings for statistics
+                                for key in distance_keys:
+                                    distance = values.get(key, 0)
+                                    if distance > 0:
+                                        distance_sum += distance
+                                        distance_count += 1
+                                
+                                if sample_count % 10 == 0:
+                                    sensor_distances = [values.get(key, 0) for key in distance_keys]
+                                    log(f"🔊 Ultrasonic: {sample_count} samples captured, distances: {sensor_distances}")
                     
                 except Exception as sample_error:
-                    print(f"❌ Ultrasonic sample error: {sample_error}")
+                    log(f"❌ Ultrasonic sample error: {sample_error}")
+                
+                if log_lines and monotonic() - last_log_flush >= _LOG_FLUSH_INTERVAL_SEC:
+                    _write_log_lines(log_lines)
+                    last_log_flush = monotonic()
                 
-                # Wait for next sample
-                time.sleep(sample_interval)
+                # Sleep until the next tick, measured from the schedule rather than from now
+                # so the time spent sampling does not add drift
+                next_tick += sample_interval
+                delay = next_tick - monotonic()
+                if delay > 0:
+                    sleep(delay)
+                else:
+                    # Overran the interval: skip the missed ticks instead of sampling in a burst
+                    next_tick = monotonic()
+            
+            # Session length excludes the writer drain below
+            capture_end = monotonic()
+            if log_lines:
+                _write_log_lines(log_lines)
+            
+            # Let the writer drain the queue and close the session file; if it is still
+            # busy, samples left in its queue are counted as not written
+            samples_not_written = 0
+            if not _stop_session_writer(writer, writer_stop):
+                samples_not_written = write_queue.qsize()
+                print(f"⚠️ Ultrasonic capture writer did not finish within {_WRITER_STOP_TIMEOUT_SEC}s")
+            write_error_count = len(write_errors)
+            if write_error_count:
+                print(f"❌ Ultrasonic write error: {write_errors[0]} ({write_error_count} samples not written)")
+            samples_not_written += write_error_count
+            
+            captured_files = [str(session_path)] if results["samples_captured"] else []
+            if not results["samples_captured"]:
+                session_path.unlink(missing_ok=True)
             
             # Calculate final results
-            end_time = time.time()
-            results["capture_duration_actual"] = end_time - start_time
+            results["capture_duration_actual"] = capture_end - start_monotonic
             results["telemetry_files"] = captured_files
-            results["total_distance_readings"] = len(total_distances)
-            results["avg_distance_cm"] = round(sum(total_distances) / len(total_distances), 1) if total_distances else 0.0
+            results["samples_dropped"] = samples_dropped
+            results["samples_not_written"] = samples_not_written
+            results["duplicate_samples_skipped"] = duplicates_skipped
+            results["total_distance_readings"] = distance_count
+            results["avg_distance_cm"] = round(distance_sum / distance_count, 1) if distance_count else 0.0
             results["sample_rate_actual"] = round(sample_count / results["capture_duration_actual"], 2) if results["capture_duration_actual"] > 0 else 0.0
             results["success"] = True
             
             print(f"✅ Timed ultrasonic capture completed:")
             print(f"   Total samples: {results['samples_captured']}")
-            print(f"   Telemetry files: {len(captured_files)}")
+            if samples_dropped:
+                print(f"   Dropped samples: {samples_dropped}")
+            if duplicates_skipped:
+                print(f"   Duplicate samples skipped: {duplicates_skipped}")
+            print(f"   Session file: {captured_files[0] if captured_files else 'none'}")
             print(f"   Distance readings: {results['total_distance_readings']}")
             print(f"   Average distance: {results['avg_distance_cm']}cm")
             print(f"   Actual sample rate: {results['sample_rate_actual']}Hz")
@@ -496,7 +740,11 @@ class UltrasonicControlService:
             error_msg = f"Timed ultrasonic capture failed: {str(e)}"
             print(f"❌ {error_msg}")
             results["error"] = error_msg
-            results["capture_duration_actual"] = time.time() - start_time if 'start_time' in locals() else 0
+            results["capture_duration_actual"] = time.monotonic() - start_monotonic if 'start_monotonic' in locals() else 0
+            if 'writer' in locals():
+                _stop_session_writer(writer, writer_stop)  # The writer closes the session file
+            elif 'session_file' in locals():
+                session_file.close()
         
         return results
 
@@ -521,21 +769,5 @@ class UltrasonicControlService:
                 "error": f"Invalid sample rate: {sample_rate_hz}Hz. Must be between 0.1 and 100.0 Hz"
             }
         
-        estimated_samples = int(capture_duration_seconds * sample_rate_hz)
         sensors_enabled = self._config.get("sensors_enabled", 4)
-        estimated_distance_readings = estimated_samples * sensors_enabled
-        
-        # Estimate file sizes (approximate)
-        telemetry_size_per_file = 1024  # ~1KB per ultrasonic telemetry JSON
-        estimated_total_size_mb = (estimated_samples * telemetry_size_per_file) / (1024 * 1024)
-        
-        return {
-            "estimated_samples": estimated_samples,
-            "estimated_distance_readings": estimated_distance_readings,
-            "sensors_enabled": sensors_enabled,
-            "sample_rate_hz": sample_rate_hz,
-            "sample_interval_seconds": 1.0 / sample_rate_hz,
-            "estimated_telemetry_files": estimated_samples,
-            "estimated_telemetry_size_mb": round(estimated_total_size_mb, 3),
-            "capture_efficiency": 100.0  # Ultrasonic captures continuously
-        }
+        return dict(_estimate_capture_session(sample_rate_hz, capture_duration_seconds, sensors_enabled))
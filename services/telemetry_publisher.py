@@ -8,7 +8,7 @@ Consolidates all publish functions from core/api.py for better organization.
 
 import json
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 
 
@@ -36,20 +36,22 @@ class TelemetryPublisher:
         self.mqtt_client = mqtt_client
         print("✅ MQTT client set for telemetry publisher")
     
-    def _publish_to_mqtt(self, topic: str, payload: Dict[str, Any]) -> bool:
+    def _publish_to_mqtt(self, topic: str, payload: Union[Dict[str, Any], bytes]) -> bool:
         """
         Publish data to MQTT topic
         
         Args:
             topic: MQTT topic to publish to
-            payload: Data payload to publish
+            payload: Data payload to publish, or an already serialized JSON payload
             
         Returns:
             bool: True if published successfully, False otherwise
         """
         try:
             if self.mqtt_client:
-                self.mqtt_client.publish(topic, json.dumps(payload))
+                if not isinstance(payload, bytes):
+                    payload = json.dumps(payload)
+                self.mqtt_client.publish(topic, payload)
                 self.publish_count += 1
                 return True
             else:
@@ -85,6 +87,31 @@ class TelemetryPublisher:
             print(f"❌ Error publishing LiDAR telemetry: {e}")
             return False
     
+    def publish_lidar_telemetry_bytes(self, payload: bytes) -> bool:
+        """
+        Publish pre-serialized LiDAR telemetry to ThingsBoard
+        
+        Args:
+            payload: LiDAR telemetry in ThingsBoard format, serialized as JSON bytes
+            
+        Returns:
+            bool: True if published successfully, False otherwise
+        """
+        try:
+            # Publish to MQTT
+            success = self._publish_to_mqtt("v1/devices/me/telemetry", payload)
+            
+            if success:
+                print(f"📡 LiDAR telemetry published successfully")
+            else:
+                print(f"⚠️ LiDAR telemetry MQTT publishing failed")
+            
+            return success
+            
+        except Exception as e:
+            print(f"❌ Error publishing LiDAR telemetry: {e}")
+            return False
+    
     def publish_occupancy_telemetry(self, occupancy_data: Dict[str, Any]) -> bool:
         """
         Publish occupancy telemetry data to ThingsBoard
@@ -119,6 +146,31 @@ class TelemetryPublisher:
             print(f"❌ Error publishing occupancy telemetry: {e}")
             return False
     
+    def publish_occupancy_telemetry_bytes(self, payload: bytes) -> bool:
+        """
+        Publish pre-serialized occupancy telemetry to ThingsBoard
+        
+        Args:
+            payload: Occupancy telemetry in ThingsBoard format, serialized as JSON bytes
+            
+        Returns:
+            bool: True if published successfully, False otherwise
+        """
+        try:
+            # Publish to MQTT
+            success = self._publish_to_mqtt("v1/devices/me/telemetry", payload)
+            
+            if success:
+                print(f"🚗 OCCUPANCY DETECTED - Published to MQTT!")
+            else:
+                print(f"⚠️ Occupancy telemetry MQTT publishing failed")
+            
+            return success
+            
+        except Exception as e:
+            print(f"❌ Error publishing occupancy telemetry: {e}")
+            return False
+    
     def publish_proximity_alert_telemetry(self, proximity_data: Dict[str, Any]) -> bool:
         """
         Publish proximity alert telemetry data to ThingsBoard
@@ -280,11 +332,21 @@ def publish_lidar_telemetry(telemetry_data: Dict[str, Any]) -> bool:
     publisher = get_telemetry_publisher()
     return publisher.publish_lidar_telemetry(telemetry_data)
 
+def publish_lidar_telemetry_bytes(payload: bytes) -> bool:
+    """Convenience function to publish pre-serialized LiDAR telemetry"""
+    publisher = get_telemetry_publisher()
+    return publisher.publish_lidar_telemetry_bytes(payload)
+
 def publish_occupancy_telemetry(occupancy_data: Dict[str, Any]) -> bool:
     """Convenience function to publish occupancy telemetry"""
     publisher = get_telemetry_publisher()
     return publisher.publish_occupancy_telemetry(occupancy_data)
 
+def publish_occupancy_telemetry_bytes(payload: bytes) -> bool:
+    """Convenience function to publish pre-serialized occupancy telemetry"""
+    publisher = get_telemetry_publisher()
+    return publisher.publish_occupancy_telemetry_bytes(payload)
+
 def publish_proximity_alert_telemetry(proximity_data: Dict[str, Any]) -> bool:
     """Convenience function to publish proximity alert telemetry"""
     publisher = get_telemetry_publisher()
@@ -11,7 +11,7 @@ import json
 import time
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 
 
 class TelemetrySaver:
@@ -87,6 +87,46 @@ class TelemetrySaver:
             print(f"❌ Error saving telemetry data: {e}")
             return False
     
+    def save_telemetry_bulk(self, rows: Iterable[Tuple[str, Dict[str, Any], int, Optional[int]]]) -> int:
+        """
+        Save several telemetry rows to database in a single transaction
+        
+        Args:
+            rows: (sensor_type, data, sync_status, timestamp) tuples; a timestamp
+                  of None uses the current time
+        
+        Returns:
+            int: Number of rows saved (0 on failure)
+        """
+        try:
+            now = int(time.time())
+            params = [
+                (timestamp if timestamp is not None else now, sensor_type,
+                 json.dumps(data, default=str), sync_status)
+                for sensor_type, data, sync_status, timestamp in rows
+            ]
+            if not params:
+                return 0
+            
+            self._ensure_table_exists()
+            
+            conn = sqlite3.connect(str(self.db_path))
+            cursor = conn.cursor()
+            
+            cursor.executemany("""
+                INSERT INTO telemetry (timestamp, sensor_type, data_json, sync_status)
+                VALUES (?, ?, ?, ?)
+            """, params)
+            
+            conn.commit()
+            conn.close()
+            
+            return len(params)
+            
+        except Exception as e:
+            print(f"❌ Error saving telemetry batch: {e}")
+            return 0
+    
     def save_lidar(self, data: Dict[str, Any], sync_status: int = 0) -> bool:
         """Save LiDAR telemetry data"""
         return self.save_telemetry('lidar', data, sync_status)
@@ -134,6 +174,19 @@ def save_telemetry(sensor_type: str, data: Dict[str, Any],
     saver = get_telemetry_saver()
     return saver.save_telemetry(sensor_type, data, sync_status)
 
+def save_telemetry_bulk(rows: Iterable[Tuple[str, Dict[str, Any], int, Optional[int]]]) -> int:
+    """
+    Convenience function to save a batch of telemetry rows in one transaction
+    
+    Args:
+        rows: (sensor_type, data, sync_status, timestamp) tuples
+    
+    Returns:
+        int: Number of rows saved
+    """
+    saver = get_telemetry_saver()
+    return saver.save_telemetry_bulk(rows)
+
 
 # Command line interface
 def main():
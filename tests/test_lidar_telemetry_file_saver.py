@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for sensors/lidar/telemetry_file_saver.py
+Covers the JSON Lines writer thread and file status reporting
+"""
+
+import json
+
+import pytest
+
+from sensors.lidar import telemetry_file_saver as saver_module
+from sensors.lidar.telemetry_file_saver import (
+    save_lidar_telemetry_to_file,
+    get_lidar_telemetry_file_status,
+    reset_lidar_telemetry_saver
+)
+
+
+@pytest.fixture
+def telemetry_dir(tmp_path, monkeypatch):
+    """Run each saver test in its own directory and close the saver afterwards"""
+    monkeypatch.chdir(tmp_path)
+    reset_lidar_telemetry_saver()
+    yield tmp_path / "data" / "telemetry"
+    reset_lidar_telemetry_saver()
+
+
+def _read_entries(file_path):
+    return [json.loads(line) for line in file_path.read_bytes().splitlines()]
+
+
+def test_writer_thread_writes_every_entry_in_order(telemetry_dir):
+    """Saved entries reach the file as one JSON object per line, in save order"""
+    for i in range(300):
+        assert save_lidar_telemetry_to_file({"ts": i, "values": {"lidar.distance_m": i / 10}})
+    file_path = saver_module._lidar_telemetry_saver["file_path"]
+
+    reset_lidar_telemetry_saver()
+
+    entries = _read_entries(file_path)
+    assert [entry["data"]["ts"] for entry in entries] == list(range(300))
+    assert all(set(entry) == {"timestamp", "readable_time", "data"} for entry in entries)
+
+
+def test_status_counts_queued_bytes_without_flushing(telemetry_dir):
+    """The reported size covers queued lines and matches the file once written"""
+    for i in range(50):
+        save_lidar_telemetry_to_file({"ts": i, "values": {}})
+    saver = saver_module._lidar_telemetry_saver
+
+    status = get_lidar_telemetry_file_status()
+
+    assert status["total_entries"] == 50
+    assert status["dropped_entries"] == 0
+    assert status["file_path"] == str(saver["file_path"])
+
+    reset_lidar_telemetry_saver()
+
+    assert saver["file_path"].stat().st_size == status["file_size_bytes"]
+
+
+def test_reset_stops_writer_thread(telemetry_dir):
+    """Resetting joins the writer thread and the next save starts a new file"""
+    save_lidar_telemetry_to_file({"ts": 1, "values": {}}, filename="first.jsonl")
+    first = saver_module._lidar_telemetry_saver
+
+    reset_lidar_telemetry_saver()
+
+    assert not first["thread"].is_alive()
+    assert get_lidar_telemetry_file_status() == {"status": "No LiDAR telemetry file active"}
+
+    save_lidar_telemetry_to_file({"ts": 2, "values": {}}, filename="second.jsonl")
+    reset_lidar_telemetry_saver()
+
+    assert [entry["data"]["ts"] for entry in _read_entries(telemetry_dir / "first.jsonl")] == [1]
+    assert [entry["data"]["ts"] for entry in _read_entries(telemetry_dir / "second.jsonl")] == [2]
+
+
+def test_full_queue_drops_oldest_lines(telemetry_dir):
+    """Beyond the queue limit the oldest queued lines are dropped and counted"""
+    save_lidar_telemetry_to_file({"ts": 0, "values": {}})
+    saver = saver_module._lidar_telemetry_saver
+    limit = saver["queue"].maxlen
+
+    # Hold the writer off so every save stays queued
+    with saver["write_lock"]:
+        saver["queue"].clear()
+        for i in range(1, limit + 11):
+            save_lidar_telemetry_to_file({"ts": i, "values": {}})
+        assert saver["dropped"] == 10
+
+    file_path = saver["file_path"]
+    reset_lidar_telemetry_saver()
+
+    written = [entry["data"]["ts"] for entry in _read_entries(file_path)]
+    assert written[-limit:] == list(range(11, limit + 11))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for sensors/ultrasonic/proximity_detector.py
+Covers skipping self-generated data while the streaming service feeds the detector
+"""
+
+import time
+
+import sensors.ultrasonic as ultrasonic_module
+from sensors.ultrasonic.proximity_detector import ProximityDetector
+
+
+def test_no_self_generated_samples_between_external_feeds(monkeypatch):
+    """A feed slower than twice the detection interval still suppresses self-generated data"""
+    generated = []
+
+    def fake_telemetry_data():
+        generated.append(time.monotonic())
+        return None
+
+    monkeypatch.setattr(ultrasonic_module, "get_ultrasonic_telemetry_data", fake_telemetry_data)
+
+    detector = ProximityDetector()
+    # Same ratio as the defaults: a 2s stream against a 0.5s detection interval
+    detector._detection_interval = 0.05
+    feed_interval = 0.2
+    telemetry = {"ts": 0, "values": {}}
+
+    detector.start_detection()
+    try:
+        # The first two feeds establish the stream's cadence
+        detector.process_telemetry_data(telemetry)
+        time.sleep(feed_interval)
+        detector.process_telemetry_data(telemetry)
+        generated.clear()
+
+        for _ in range(5):
+            time.sleep(feed_interval)
+            detector.process_telemetry_data(telemetry)
+
+        assert generated == []
+    finally:
+        detector.stop_detection()
+
+
+def test_self_generated_samples_resume_after_feed_stops(monkeypatch):
+    """Once external feeds stop, the detection loop generates its own data again"""
+    generated = []
+
+    def fake_telemetry_data():
+        generated.append(time.monotonic())
+        return None
+
+    monkeypatch.setattr(ultrasonic_module, "get_ultrasonic_telemetry_data", fake_telemetry_data)
+
+    detector = ProximityDetector()
+    detector._detection_interval = 0.05
+    telemetry = {"ts": 0, "values": {}}
+
+    detector.start_detection()
+    try:
+        detector.process_telemetry_data(telemetry)
+        time.sleep(0.2)
+        detector.process_telemetry_data(telemetry)
+        generated.clear()
+
+        # 1.5x the 0.2s cadence has passed well before this
+        time.sleep(0.6)
+
+        assert generated
+    finally:
+        detector.stop_detection()
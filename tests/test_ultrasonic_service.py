@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tests for sensors/ultrasonic/ultrasonic_service.py
+Covers skipping repeated readings during a timed capture
+"""
+
+import json
+import time
+
+from sensors.ultrasonic import ultrasonic_service as service_module
+from sensors.ultrasonic.ultrasonic_service import UltrasonicControlService
+
+
+def test_timed_capture_skips_repeated_readings(tmp_path, monkeypatch):
+    """A reading repeated with a fresh ts is skipped as a duplicate"""
+    calls = []
+
+    def repeating_telemetry_data():
+        # Each reading is returned twice in a row, re-stamped with a new ts
+        calls.append(None)
+        reading = (len(calls) + 1) // 2
+        return {
+            "ts": int(time.time() * 1000) + len(calls),
+            "values": {"ultrasonic.sensor_1.distance_cm": float(reading)}
+        }
+
+    monkeypatch.setattr(service_module, "_get_ultrasonic_telemetry_data", repeating_telemetry_data)
+
+    results = UltrasonicControlService().timed_ultrasonic_capture(20, 1, str(tmp_path), device_id="test")
+
+    assert results["success"] is True
+    assert results["duplicate_samples_skipped"] == len(calls) // 2
+    assert results["samples_captured"] == len(calls) - len(calls) // 2
+
+    with open(results["telemetry_files"][0], "rb") as session_file:
+        readings = [json.loads(line)["data"]["values"]["ultrasonic.sensor_1.distance_cm"]
+                    for line in session_file]
+    assert readings == [float(reading) for reading in range(1, len(readings) + 1)]
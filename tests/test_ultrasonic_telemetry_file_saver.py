@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for sensors/ultrasonic/telemetry_file_saver.py
+Covers the backwards tail reader and the JSON Lines writer thread
+"""
+
+import json
+import threading
+
+import pytest
+
+from sensors.ultrasonic import telemetry_file_saver as saver_module
+from sensors.ultrasonic.telemetry_file_saver import (
+    _read_tail_lines,
+    save_ultrasonic_telemetry_to_file,
+    flush_ultrasonic_telemetry_file,
+    get_ultrasonic_telemetry_file_status,
+    get_ultrasonic_telemetry_summary,
+    reset_ultrasonic_telemetry_file
+)
+
+
+@pytest.fixture
+def telemetry_dir(tmp_path, monkeypatch):
+    """Run each saver test in its own directory and close the saver afterwards"""
+    monkeypatch.chdir(tmp_path)
+    reset_ultrasonic_telemetry_file()
+    yield tmp_path / "data" / "telemetry"
+    reset_ultrasonic_telemetry_file()
+
+
+def _write_file(path, data: bytes):
+    path.write_bytes(data)
+    return path
+
+
+def test_read_tail_lines_without_trailing_newline(tmp_path):
+    """The last line is returned even when the file does not end in a newline"""
+    path = _write_file(tmp_path / "t.jsonl", b"a\nb\nc")
+
+    assert _read_tail_lines(path, 2) == [b"b", b"c"]
+
+
+def test_read_tail_lines_limit_larger_than_file(tmp_path):
+    """A limit beyond the number of lines returns every line"""
+    path = _write_file(tmp_path / "t.jsonl", b"one\ntwo\nthree\n")
+
+    assert _read_tail_lines(path, 100) == [b"one", b"two", b"three"]
+
+
+def test_read_tail_lines_line_across_block_boundary(tmp_path):
+    """A line split across the 64 KiB block boundary comes back whole"""
+    block_size = 64 * 1024
+    long_line = b"x" * 100
+    # The file is exactly two blocks long and the long line starts 50 bytes
+    # before the last block, so the first backwards read cuts it in half
+    head = b"h" * (block_size - 51) + b"\n"
+    tail_padding = b"y" * (block_size + 50 - len(long_line) - 2)
+    data = head + long_line + b"\n" + tail_padding + b"\n"
+    assert len(data) == 2 * block_size
+    path = _write_file(tmp_path / "t.jsonl", data)
+
+    assert _read_tail_lines(path, 2) == [long_line, tail_padding]
+    assert _read_tail_lines(path, 3) == [head.rstrip(b"\n"), long_line, tail_padding]
+
+
+def test_read_tail_lines_across_many_small_blocks(tmp_path):
+    """Lines are reassembled correctly when every line spans several blocks"""
+    expected = [json.dumps({"n": i, "pad": "p" * 40}).encode() for i in range(20)]
+    path = _write_file(tmp_path / "t.jsonl", b"\n".join(expected) + b"\n")
+
+    assert _read_tail_lines(path, 5, block_size=7) == expected[-5:]
+
+
+def test_read_tail_lines_empty_file(tmp_path):
+    """An empty file has no lines"""
+    path = _write_file(tmp_path / "t.jsonl", b"")
+
+    assert _read_tail_lines(path, 10) == []
+
+
+def test_read_tail_lines_non_positive_limit(tmp_path):
+    """A zero limit reads nothing"""
+    path = _write_file(tmp_path / "t.jsonl", b"a\nb\n")
+
+    assert _read_tail_lines(path, 0) == []
+
+
+def test_writer_thread_writes_every_entry_in_order(telemetry_dir):
+    """Saved entries reach the file as one JSON object per line, in entry order"""
+    for i in range(200):
+        assert save_ultrasonic_telemetry_to_file({"ts": i, "values": {"ultrasonic.sensor1.distance_cm": i}})
+
+    assert flush_ultrasonic_telemetry_file()
+    status = get_ultrasonic_telemetry_file_status()
+    file_path = telemetry_dir / status["filename"]
+
+    entries = [json.loads(line) for line in file_path.read_bytes().splitlines()]
+    assert [entry["entry_number"] for entry in entries] == list(range(1, 201))
+    assert [entry["data"]["ts"] for entry in entries] == list(range(200))
+    assert status["total_entries"] == 200
+    assert status["dropped_entries"] == 0
+    assert status["file_size_bytes"] == file_path.stat().st_size
+
+
+def test_writer_thread_writes_queued_entries_on_reset(telemetry_dir):
+    """Resetting stops the writer thread after it writes what is still queued"""
+    for i in range(10):
+        save_ultrasonic_telemetry_to_file({"ts": i, "values": {}})
+    saver = saver_module.ultrasonic_telemetry_saver
+    file_path = saver["file_path"]
+    queued_size = get_ultrasonic_telemetry_file_status()["file_size_bytes"]
+
+    result = reset_ultrasonic_telemetry_file()
+
+    assert result["success"] is True
+    assert result["previous_entries"] == 10
+    assert not saver["thread"].is_alive()
+    assert saver["file"].closed
+    assert file_path.stat().st_size == queued_size
+    assert len(file_path.read_bytes().splitlines()) == 10
+
+
+def test_writer_thread_with_concurrent_saves(telemetry_dir):
+    """Saves from several threads each get a unique entry number and a line in the file"""
+    def save_many(thread_index):
+        for i in range(250):
+            save_ultrasonic_telemetry_to_file({"ts": i, "values": {"thread": thread_index}})
+
+    threads = [threading.Thread(target=save_many, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    file_path = saver_module.ultrasonic_telemetry_saver["file_path"]
+    reset_ultrasonic_telemetry_file()
+
+    entries = [json.loads(line) for line in file_path.read_bytes().splitlines()]
+    assert [entry["entry_number"] for entry in entries] == list(range(1, 1001))
+
+
+def test_failed_write_is_counted(telemetry_dir, monkeypatch):
+    """Lines from a batch that fails to write are reported as failed entries"""
+    def failing_write_lines(fd, batch):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(saver_module, "_write_lines", failing_write_lines)
+    for i in range(5):
+        save_ultrasonic_telemetry_to_file({"ts": i, "values": {}})
+
+    # Whether this flush or the writer thread drains the batch, it fails the same way
+    flush_ultrasonic_telemetry_file()
+    status = get_ultrasonic_telemetry_file_status()
+
+    assert status["failed_entries"] == 5
+    assert status["total_entries"] == 5
+    assert status["file_size_bytes"] == 0
+
+
+def test_summary_with_zero_limit_includes_every_entry(telemetry_dir):
+    """A limit of 0 summarizes the whole file, beyond the in-memory window"""
+    total = saver_module._RECENT_ENTRIES_MAX + 50
+    for i in range(total):
+        save_ultrasonic_telemetry_to_file({"ts": i, "values": {"ultrasonic.sensor_1.distance_cm": 100.0}})
+
+    summary = get_ultrasonic_telemetry_summary(limit=0)
+
+    assert summary["summary_available"] is True
+    assert summary["file_status"]["recent_entries_analyzed"] == total
+    assert [entry["data"]["ts"] for entry in summary["recent_entries"]] == list(range(total))
+
+
+def test_summary_with_positive_limit_returns_latest_entries(telemetry_dir):
+    """A positive limit summarizes only the most recent entries"""
+    for i in range(20):
+        save_ultrasonic_telemetry_to_file({"ts": i, "values": {"ultrasonic.sensor_1.distance_cm": 100.0}})
+
+    summary = get_ultrasonic_telemetry_summary(limit=5)
+
+    assert [entry["data"]["ts"] for entry in summary["recent_entries"]] == list(range(15, 20))